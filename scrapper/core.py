@@ -1,26 +1,141 @@
 # scrapper/core.py - NO REVIEWS VERSION with improved coordinate/website extraction
 import asyncio
+import inspect
 import logging
-import platform
+import os
 import random
+import re
+import sys
 import time
-from typing import List
+from types import FrameType
+from typing import AsyncIterator, List, NamedTuple, Optional
 from contextlib import asynccontextmanager
+from urllib.parse import parse_qs, urlsplit
 
 from patchright.async_api import async_playwright, Browser, BrowserContext, Page
+import patchright._impl._connection as _pw_connection
+
+
+class _FrameRecord(NamedTuple):
+    """The inspect.FrameInfo fields patchright reads, without the source lines."""
+    frame: FrameType
+    filename: str
+    lineno: int
+    function: str
+
+
+class _CheapStackInspect:
+    """
+    Stand-in for the inspect module inside patchright's connection module only.
+    stack() walks the frames directly instead of reading every frame's source
+    file; everything else is delegated to the real inspect module.
+    """
+
+    @staticmethod
+    def stack(context: int = 1) -> List[_FrameRecord]:
+        records = []
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            records.append(_FrameRecord(frame, code.co_filename, frame.f_lineno, code.co_name))
+            frame = frame.f_back
+        return records
+
+    def __getattr__(self, name):
+        return getattr(inspect, name)
+
+
+# Patchright captures the caller's stack via inspect.stack() on every API call to
+# name the API and attach debug traces. With source context that is very expensive
+# in our hot loops, so give its connection module a cheap stack() unless the real
+# one is explicitly requested with PW_INSPECT_STACK=1.
+if os.getenv("PW_INSPECT_STACK", "0") == "0":
+    _pw_connection.inspect = _CheapStackInspect()
 
 from .models import Place
 from .extractors import extract_place
 
 
+# Marker of Google's outbound redirect links (google.com/url?q=<target>)
+_GOOGLE_REDIRECT = 'google.com/url?q='
+
+# Coordinates in a place URL: /@lat,lng,zoom
+_COORD_URL_RE = re.compile(r'/@(-?\d+\.?\d*),(-?\d+\.?\d*),')
+
+# Coordinates embedded in a listing href: ...!3dlat!4dlng...
+_COORD_HREF_RE = re.compile(r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)')
+
+# Rating and review count as shown on a result card, e.g. "4.6" and "(123)"
+_CARD_RATING_RE = re.compile(r'(\d+(?:[.,]\d+)?)')
+_CARD_REVIEWS_RE = re.compile(r'(\d+)')
+
+# Metadata already rendered in each search result card, read in one pass
+_LISTING_CARDS_JS = """els => els.map(a => {
+    const card = a.parentElement;  // the result link has its own jsaction; its parent is the card
+    return {
+        href: a.href,
+        name: a.getAttribute('aria-label') || card?.querySelector('.qBF1Pd')?.innerText || null,
+        rating: card?.querySelector('.MW4etd')?.innerText || null,
+        reviews: card?.querySelector('.UY7F9')?.innerText || null,
+    };
+})"""
+
+# Coordinate pairs inside the inlined APP_INITIALIZATION_STATE blob, most reliable
+# first. Tried one pattern at a time: the generic [lat,lng] one also matches small
+# integer pairs, so it must not compete with the place's own coordinates.
+_COORD_PATTERNS = (
+    re.compile(r'null,\[null,null,(-?\d+\.?\d*),(-?\d+\.?\d*)\]'),
+    re.compile(r'\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]'),
+    re.compile(r'"lat":(-?\d+\.?\d*),"lng":(-?\d+\.?\d*)'),
+)
+
+# Size parameters on googleusercontent image URLs, e.g. =s100-k-no or =w100-h100
+_GUSR_SIZE_RE = re.compile(r'=s\d+-.*?(?=&|$)')
+_GUSR_WH_RE = re.compile(r'=w\d+-h\d+.*?(?=&|$)')
+
+# Returns only the inline script that carries Google Maps' initial state,
+# capped so at most `maxLength` characters are sent back over CDP
+_INIT_STATE_SCRIPT_JS = """(maxLength) => {
+    for (const script of document.scripts) {
+        if (!script.src && script.textContent.includes('APP_INITIALIZATION_STATE')) {
+            return script.textContent.slice(0, maxLength);
+        }
+    }
+    return '';
+}"""
+_INIT_STATE_MAX_CHARS = 500_000
+
+# For each selector, the first non-empty attribute (in order) of its first match
+_FIRST_ATTRIBUTE_JS = """([selectors, attributes]) => selectors.map(selector => {
+    const el = document.querySelector(selector);
+    if (!el) return null;
+    for (const attribute of attributes) {
+        const value = el.getAttribute(attribute);
+        if (value) return value;
+    }
+    return null;
+})"""
+
+# Resources the scraper never needs: place data is read from the DOM, and image
+# URLs come from src/data-src attributes rather than the downloaded bitmaps.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+)
+
+
 class BrowserManager:
     """
     A reusable class to manage Patchright browser lifecycle with consistent configuration.
     Adds stealth and human-like behavior.
     """
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, block_resources: bool = True):
         self.headless = headless
+        self.block_resources = block_resources
         self.playwright = None
         self.browser: Browser = None
         self.context: BrowserContext = None
@@ -29,13 +144,9 @@ class BrowserManager:
         """Launch browser with stealth settings."""
         self.playwright = await async_playwright().start()
 
-        executable_path = (
-            r"C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"
-            if platform.system() == "Windows" else None
-        )
-
+        # Use the system Google Chrome on every platform (recommended by Patchright for stealth)
         self.browser = await self.playwright.chromium.launch(
-            executable_path=executable_path,
+            channel="chrome",
             headless=self.headless,
             args=[
                 '--no-sandbox',
@@ -51,12 +162,22 @@ class BrowserManager:
             ]
         )
 
+        await self.new_context()
+        return self
+
+    async def new_context(self, storage_state: Optional[dict] = None) -> BrowserContext:
+        """Create a browser context with request filtering and stealth scripts."""
         self.context = await self.browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             viewport={'width': 1366, 'height': 768},
-            ignore_https_errors=True
+            ignore_https_errors=True,
+            storage_state=storage_state
         )
 
+        # Skip heavy resources and trackers to speed up page loads
+        if self.block_resources:
+            await self.context.route("**/*", self._block_heavy_resources)
+
         # Stealth: Hide automation flags
         await self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
@@ -75,7 +196,27 @@ class BrowserManager:
             });
         """)
 
-        return self
+        return self.context
+
+    async def recycle_context(self) -> BrowserContext:
+        """
+        Replace the current context with a fresh one, keeping cookies and storage.
+        Patchright only frees per-request objects when a context is closed.
+        """
+        storage_state = await self.context.storage_state()
+        await self.context.close()
+        return await self.new_context(storage_state=storage_state)
+
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Abort images, fonts, stylesheets, media and analytics requests."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            domain in request.url for domain in BLOCKED_DOMAINS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def new_page(self) -> Page:
         page = await self.context.new_page()
@@ -111,197 +252,307 @@ class GoogleMapsScraper:
     Focuses on extracting coordinates and website URLs.
     """
     BASE_URL = "https://www.google.com/maps"
-
-    def __init__(self, headless: bool = False):
+    MAX_PARALLEL = 4  # Number of tabs processing places concurrently
+    CONTEXT_RECYCLE_EVERY = 50  # Places processed before the browser context is recycled
+
+    def __init__(self, headless: bool = False, fast_mode: bool = False):
+        """
+        Args:
+            headless: Run the browser without a window
+            fast_mode: Build places straight from their search result card when it
+                already has name, rating, review count and coordinates, skipping the
+                detail page (no address, phone, website or image for those places)
+        """
         self.browser_manager = BrowserManager(headless=headless)
+        self.fast_mode = fast_mode
 
     async def scrape_places(self, search_for: str, total: int) -> List[Place]:
-        places: List[Place] = []
+        """Scrape places and return them as a list."""
+        return [place async for place in self.iter_places(search_for, total)]
+
+    async def iter_places(self, search_for: str, total: int) -> AsyncIterator[Place]:
+        """Scrape places, yielding each one as soon as it has been extracted."""
+        found = 0
         try:
             await self.browser_manager.start()
-            async with self.browser_manager.get_page() as page:
-                logging.info("🌍 Navigating to Google Maps...")
-                await page.goto(self.BASE_URL, timeout=60000)
-                await asyncio.sleep(random.uniform(2.0, 4.0))
-
-                # Search query
-                logging.info(f"🔍 Searching for: {search_for}")
-                search_box = page.locator('//input[@id="searchboxinput"]')
-                await search_box.fill(search_for)
-                await page.keyboard.press("Enter")
-                await asyncio.sleep(2.5)
-
-                # Wait for results
-                try:
-                    await page.wait_for_selector('//a[contains(@href, "/maps/place/")]', timeout=20000)
-                    logging.info("✅ Search results loaded")
-                except Exception:
-                    logging.error("❌ No results found or timeout")
-                    return places
+            listings = await self._collect_listings(search_for, total)
+            if not listings:
+                return
 
-                # IMPROVED SCROLLING LOGIC
-                listings_locator = page.locator('//a[contains(@href, "/maps/place/")]')
-                previously_counted = 0
-                scroll_attempts = 0
-                max_scroll_attempts = 30
-                no_new_results_count = 0
+            logging.info(f"📬 Processing {len(listings)} place listings (targeting {total} valid places)...")
 
-                logging.info(f"🎯 Target: {total} places")
-                
-                while scroll_attempts < max_scroll_attempts:
-                    await page.mouse.wheel(0, 15000)
-                    await asyncio.sleep(random.uniform(2.0, 4.0))
-                    
-                    found = await listings_locator.count()
-                    logging.info(f"📌 Found {found} places (attempt {scroll_attempts + 1})")
+            # Open a small pool of tabs, each place is opened directly by URL in its own tab
+            pool_size = min(self.MAX_PARALLEL, len(listings))
+            page_pool = await self._open_page_pool(pool_size)
+            places_processed_in_context = 0
 
+            try:
+                # Fan out in batches so we can stop as soon as the target is reached
+                for batch_start in range(0, len(listings), self.MAX_PARALLEL):
                     if found >= total:
-                        logging.info(f"🎉 Reached target of {total} places!")
-                        break
-                        
-                    if found == previously_counted:
-                        no_new_results_count += 1
-                        logging.info(f"⏳ No new results ({no_new_results_count}/5)")
-                        
-                        if no_new_results_count == 2:
-                            try:
-                                sidebar = page.locator('[role="main"]')
-                                if await sidebar.count() > 0:
-                                    await sidebar.scroll_into_view_if_needed()
-                                    await page.mouse.wheel(0, 10000)
-                                    logging.info("🔄 Tried scrolling sidebar")
-                            except:
-                                pass
-                                
-                        if no_new_results_count >= 5:
-                            logging.info("🛑 No more new places loading after 5 attempts.")
-                            break
-                    else:
-                        no_new_results_count = 0
-                        
-                    previously_counted = found
-                    scroll_attempts += 1
-
-                # Get listings
-                buffer_multiplier = 1.5
-                target_raw_listings = min(int(total * buffer_multiplier), await listings_locator.count())
-                raw_listings = await listings_locator.all()
-                listings = [listing.locator("xpath=..") for listing in raw_listings[:target_raw_listings]]
-                
-                logging.info(f"📬 Processing {len(listings)} place listings (targeting {total} valid places)...")
-
-                # Process each place
-                for idx, listing in enumerate(listings):
-                    if len(places) >= total:
                         logging.info(f"🎯 Reached target of {total} valid places!")
                         break
-                        
-                    try:
-                        logging.info(f"📍 Processing place {idx + 1}/{len(listings)} (valid: {len(places)}/{total})")
-
-                        # Human-like delay before interaction
-                        await asyncio.sleep(random.uniform(1.5, 3.5))
-
-                        # Click listing with retry logic
-                        max_click_attempts = 3
-                        click_success = False
-                        
-                        for click_attempt in range(max_click_attempts):
-                            try:
-                                await listing.click(timeout=5000)
-                                click_success = True
-                                break
-                            except Exception as e:
-                                logging.warning(f"⚠️ Click attempt {click_attempt + 1} failed: {str(e)}")
-                                if click_attempt < max_click_attempts - 1:
-                                    await asyncio.sleep(1)
-                                    
-                        if not click_success:
-                            logging.error(f"❌ Failed to click listing {idx + 1} after {max_click_attempts} attempts")
-                            continue
 
-                        logging.info("⏳ Waiting for place details to load...")
-                        await page.wait_for_timeout(4000)
-                        await page.wait_for_timeout(random.randint(1000, 2000))
+                    batch = listings[batch_start:batch_start + self.MAX_PARALLEL]
+                    results = await asyncio.gather(*[
+                        self._process_place(page_pool, listing, batch_start + offset, len(listings))
+                        for offset, listing in enumerate(batch)
+                    ])
+                    places_processed_in_context += len(batch)
 
-                        # EXTRACT COORDINATES FROM URL FIRST (most reliable method)
-                        current_url = page.url
-                        coordinates = await self.extract_coordinates_from_url(current_url)
-                        
-                        # Extract basic place data
-                        place = await extract_place(page)
-                        
-                        # Override coordinates if we got them from URL
-                        if coordinates:
-                            place.latitude = coordinates['latitude']
-                            place.longitude = coordinates['longitude']
-                            logging.info(f"🗺️ Coordinates from URL: {place.latitude}, {place.longitude}")
-                        
-                        # Try additional coordinate extraction if still missing
-                        if not place.has_coordinates():
-                            logging.info("🔍 Trying additional coordinate extraction methods...")
-                            additional_coords = await self.extract_coordinates_advanced(page)
-                            if additional_coords:
-                                place.latitude = additional_coords['latitude']
-                                place.longitude = additional_coords['longitude']
-                                logging.info(f"🗺️ Coordinates from advanced: {place.latitude}, {place.longitude}")
-                        
-                        # Try additional website extraction if missing
-                        if not place.website:
-                            logging.info("🔍 Trying additional website extraction methods...")
-                            website = await self.extract_website_advanced(page)
-                            if website:
-                                place.website = website
-                                logging.info(f"🌐 Website found: {place.website}")
-
-                        # Try additional image extraction if missing
-                        if not place.image_url:
-                            logging.info("🔍 Trying additional image extraction methods...")
-                            image_url = await self.extract_image_advanced(page)
-                            if image_url:
-                                place.image_url = image_url
-                                logging.info(f"🖼️ Image found: {place.image_url}")
-
-                        if not place.name or place.name in ["", "Unknown", "Failed to extract"]:
-                            logging.warning(f"⚠️ Skipping place {idx + 1} - invalid name: {place.name}")
+                    for place in results:
+                        if place is None or found >= total:
                             continue
-
-                        places.append(place)
+                        found += 1
 
                         # Log success with all fields
                         logging.info(
-                            f"✅ Added ({len(places)}/{total}): {place.name} | "
+                            f"✅ Added ({found}/{total}): {place.name} | "
                             f"⭐ {place.rating or 'N/A'} ({place.reviews_count or 0} reviews) | "
                             f"📞 {place.phone or 'No phone'} | "
                             f"🌐 {place.website or 'No website'} | "
                             f"🖼️ {place.image_url or 'No image'} | "
                             f"📍 {f'({place.latitude}, {place.longitude})' if place.has_coordinates() else 'No coordinates'}"
                         )
-
-                        # Human-like pause after reading a place
-                        wait_time = random.uniform(2.5, 6.0)
-                        logging.info(f"⏸️  Sleeping for {wait_time:.2f}s before next place...")
-                        await asyncio.sleep(wait_time)
-
-                    except Exception as e:
-                        logging.error(f"❌ Failed processing listing {idx + 1}: {str(e)}")
-                        await asyncio.sleep(random.uniform(1.0, 3.0))
-                        continue
+                        yield place
+
+                    # Recycle the context periodically to release memory held by Patchright
+                    if places_processed_in_context >= self.CONTEXT_RECYCLE_EVERY:
+                        logging.info(f"♻️ Recycling browser context after {places_processed_in_context} places")
+                        await self._close_page_pool(page_pool)
+                        await self.browser_manager.recycle_context()
+                        page_pool = await self._open_page_pool(pool_size)
+                        places_processed_in_context = 0
+            finally:
+                await self._close_page_pool(page_pool)
 
         except Exception as e:
             logging.error(f"🚨 Scraping error: {str(e)}")
         finally:
             await self.browser_manager.close()
 
-        logging.info(f"🎉 Scraping completed! Extracted {len(places)} places (requested: {total}).")
-        return places
+        logging.info(f"🎉 Scraping completed! Extracted {found} places (requested: {total}).")
+
+    async def _open_page_pool(self, size: int) -> asyncio.Queue:
+        """Open `size` tabs in the current context and return them as a pool."""
+        page_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            page_pool.put_nowait(await self.browser_manager.new_page())
+        return page_pool
+
+    @staticmethod
+    async def _close_page_pool(page_pool: asyncio.Queue) -> None:
+        """Close every tab in the pool."""
+        while not page_pool.empty():
+            await page_pool.get_nowait().close()
+
+    async def _collect_listings(self, search_for: str, total: int) -> List[dict]:
+        """Run the search, scroll the results list and return the listing cards (href, name, rating, reviews)."""
+        async with self.browser_manager.get_page() as page:
+            logging.info("🌍 Navigating to Google Maps...")
+            await page.goto(self.BASE_URL, timeout=60000)
+            await asyncio.sleep(random.uniform(2.0, 4.0))
+
+            # Search query
+            logging.info(f"🔍 Searching for: {search_for}")
+            search_box = page.locator('//input[@id="searchboxinput"]')
+            await search_box.fill(search_for)
+            await page.keyboard.press("Enter")
+            await asyncio.sleep(2.5)
+
+            # Wait for results
+            try:
+                await page.wait_for_selector('//a[contains(@href, "/maps/place/")]', timeout=20000)
+                logging.info("✅ Search results loaded")
+            except Exception:
+                logging.error("❌ No results found or timeout")
+                return []
+
+            # IMPROVED SCROLLING LOGIC
+            listings_locator = page.locator('//a[contains(@href, "/maps/place/")]')
+            previously_counted = 0
+            scroll_attempts = 0
+            max_scroll_attempts = 30
+            no_new_results_count = 0
+
+            logging.info(f"🎯 Target: {total} places")
+
+            while scroll_attempts < max_scroll_attempts:
+                await page.mouse.wheel(0, 15000)
+                await asyncio.sleep(random.uniform(2.0, 4.0))
+
+                found = await listings_locator.count()
+                logging.info(f"📌 Found {found} places (attempt {scroll_attempts + 1})")
+
+                if found >= total:
+                    logging.info(f"🎉 Reached target of {total} places!")
+                    break
+
+                if found == previously_counted:
+                    no_new_results_count += 1
+                    logging.info(f"⏳ No new results ({no_new_results_count}/5)")
+
+                    if no_new_results_count == 2:
+                        try:
+                            sidebar = page.locator('[role="main"]')
+                            if await sidebar.count() > 0:
+                                await sidebar.scroll_into_view_if_needed()
+                                await page.mouse.wheel(0, 10000)
+                                logging.info("🔄 Tried scrolling sidebar")
+                        except:
+                            pass
+
+                    if no_new_results_count >= 5:
+                        logging.info("🛑 No more new places loading after 5 attempts.")
+                        break
+                else:
+                    no_new_results_count = 0
+
+                previously_counted = found
+                scroll_attempts += 1
+
+            # Get listing URLs and card data in a single round-trip
+            buffer_multiplier = 1.5
+            listings = await listings_locator.evaluate_all(_LISTING_CARDS_JS)
+
+            # Google re-renders cards while scrolling, so the same place can appear twice
+            seen_hrefs = set()
+            unique_listings = []
+            for listing in listings:
+                if listing['href'] not in seen_hrefs:
+                    seen_hrefs.add(listing['href'])
+                    unique_listings.append(listing)
+            if len(unique_listings) < len(listings):
+                logging.info(f"🧹 Dropped {len(listings) - len(unique_listings)} duplicate listings")
+
+            return unique_listings[:int(total * buffer_multiplier)]
+
+    @staticmethod
+    def _place_from_card(listing: dict) -> Place:
+        """Build a partial Place from the data shown on a search result card."""
+        place = Place(name=(listing.get('name') or '').strip() or None)
+
+        rating_match = _CARD_RATING_RE.search(listing.get('rating') or '')
+        if rating_match:
+            rating = float(rating_match.group(1).replace(',', '.'))
+            if 0 <= rating <= 5:
+                place.rating = rating
+
+        reviews_match = _CARD_REVIEWS_RE.search((listing.get('reviews') or '').replace(',', ''))
+        if reviews_match:
+            place.reviews_count = int(reviews_match.group(1))
+
+        coord_match = _COORD_HREF_RE.search(listing.get('href') or '')
+        if coord_match:
+            place.latitude = float(coord_match.group(1))
+            place.longitude = float(coord_match.group(2))
+
+        return place
+
+    async def _process_place(self, page_pool: asyncio.Queue, listing: dict, idx: int, count: int) -> Optional[Place]:
+        """Open a place URL in a pooled tab and extract its data."""
+        card_place = self._place_from_card(listing)
+        if (self.fast_mode and card_place.name and card_place.rating is not None
+                and card_place.reviews_count is not None and card_place.has_coordinates()):
+            logging.info(f"⚡ Place {idx + 1}/{count} taken from its result card: {card_place.name}")
+            return card_place
+
+        url = listing['href']
+        page = await page_pool.get()
+        try:
+            logging.info(f"📍 Processing place {idx + 1}/{count}")
+
+            # Short jitter so the tabs don't fire requests in lockstep
+            await asyncio.sleep(random.uniform(0.2, 0.5))
+
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+            logging.info("⏳ Waiting for place details to load...")
+            try:
+                # Resolves as soon as any of the detail panel anchors is rendered
+                await (
+                    page.locator('h1.DUwDvf')
+                    .or_(page.locator('[data-item-id="address"]'))
+                    .or_(page.locator('button[data-item-id^="phone"]'))
+                    .first.wait_for(timeout=8000)
+                )
+            except Exception:
+                logging.warning(f"⚠️ Place details did not appear for listing {idx + 1}, extracting anyway")
+
+            # EXTRACT COORDINATES FROM URL FIRST (most reliable method)
+            current_url = page.url
+            coordinates = await self.extract_coordinates_from_url(current_url)
+
+            # Extract basic place data
+            place = await extract_place(page)
+
+            # Override coordinates if we got them from URL
+            if coordinates:
+                place.latitude = coordinates['latitude']
+                place.longitude = coordinates['longitude']
+                logging.info(f"🗺️ Coordinates from URL: {place.latitude}, {place.longitude}")
+
+            # The URL may not carry /@lat,lng yet right after load, give it a moment
+            if not place.has_coordinates():
+                coordinates = await self._poll_url_coordinates(page)
+                if coordinates:
+                    place.latitude = coordinates['latitude']
+                    place.longitude = coordinates['longitude']
+                    logging.info(f"🗺️ Coordinates from URL: {place.latitude}, {place.longitude}")
+
+            # Fall back to what the result card showed
+            if not place.name or place.name == "Unknown":
+                place.name = card_place.name or place.name
+            if place.rating is None:
+                place.rating = card_place.rating
+            if place.reviews_count is None:
+                place.reviews_count = card_place.reviews_count
+            if not place.has_coordinates() and card_place.has_coordinates():
+                place.latitude = card_place.latitude
+                place.longitude = card_place.longitude
+
+            # Fill in missing fields concurrently; these probes only read the page
+            if not place.has_coordinates() or not place.website or not place.image_url:
+                logging.info("🔍 Trying additional extraction methods...")
+                additional_coords, website, image_url = await asyncio.gather(
+                    self.extract_coordinates_advanced(page) if not place.has_coordinates() else _none(),
+                    self.extract_website_advanced(page, allow_click=False) if not place.website else _none(),
+                    self.extract_image_advanced(page, allow_click=False) if not place.image_url else _none(),
+                )
+                if additional_coords:
+                    place.latitude = additional_coords['latitude']
+                    place.longitude = additional_coords['longitude']
+                    logging.info(f"🗺️ Coordinates from advanced: {place.latitude}, {place.longitude}")
+                if website:
+                    place.website = website
+                    logging.info(f"🌐 Website found: {place.website}")
+                if image_url:
+                    place.image_url = image_url
+                    logging.info(f"🖼️ Image found: {place.image_url}")
+
+            # Clicking buttons changes the page, so these fallbacks run one at a time
+            if not place.website:
+                place.website = await self._reveal_website_by_click(page)
+            if not place.image_url:
+                place.image_url = await self._reveal_image_by_click(page)
+
+            if not place.name or place.name in ["", "Unknown", "Failed to extract"]:
+                logging.warning(f"⚠️ Skipping place {idx + 1} - invalid name: {place.name}")
+                return None
+
+            return place
+
+        except Exception as e:
+            logging.error(f"❌ Failed processing listing {idx + 1}: {str(e)}")
+            return None
+        finally:
+            page_pool.put_nowait(page)
 
     async def extract_coordinates_from_url(self, url: str) -> dict or None:
         """Extract coordinates from Google Maps URL - most reliable method."""
-        import re
         try:
             # Pattern for coordinates in URL: /@lat,lng,zoom
-            coord_match = re.search(r'/@(-?\d+\.?\d*),(-?\d+\.?\d*),', url)
+            coord_match = _COORD_URL_RE.search(url)
             if coord_match:
                 latitude = float(coord_match.group(1))
                 longitude = float(coord_match.group(2))
@@ -312,72 +563,72 @@ class GoogleMapsScraper:
             logging.debug(f"Failed to extract coordinates from URL: {e}")
         return None
 
+    async def _poll_url_coordinates(self, page: Page, attempts: int = 3, interval: float = 0.2) -> dict or None:
+        """Re-check the page URL a few times for coordinates before using heavier methods."""
+        for _ in range(attempts):
+            await asyncio.sleep(interval)
+            coordinates = await self.extract_coordinates_from_url(page.url)
+            if coordinates:
+                return coordinates
+        return None
+
     async def extract_coordinates_advanced(self, page: Page) -> dict or None:
-        """Advanced coordinate extraction from page content."""
-        import re
+        """Advanced coordinate extraction from the page's initial state script."""
         try:
-            # Get page content
-            page_content = await page.content()
-            
-            # Multiple regex patterns for finding coordinates
-            patterns = [
-                r'null,\[null,null,(-?\d+\.?\d*),(-?\d+\.?\d*)\]',
-                r'\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]',
-                r'"lat":(-?\d+\.?\d*),"lng":(-?\d+\.?\d*)',
-                r'latitude.*?(-?\d+\.?\d*).*?longitude.*?(-?\d+\.?\d*)',
-                r'center.*?\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, page_content)
-                if matches:
+            # Fetch only the init-state script instead of the whole page HTML
+            script_content = await page.evaluate(_INIT_STATE_SCRIPT_JS, _INIT_STATE_MAX_CHARS)
+
+            for pattern in _COORD_PATTERNS:
+                for match in pattern.finditer(script_content):
                     try:
-                        for match in matches:
-                            lat, lng = match[0], match[1]
-                            latitude = float(lat)
-                            longitude = float(lng)
-                            # Validate coordinates
-                            if -90 <= latitude <= 90 and -180 <= longitude <= 180:
-                                return {'latitude': latitude, 'longitude': longitude}
-                    except (ValueError, IndexError):
+                        latitude = float(match.group(1))
+                        longitude = float(match.group(2))
+                    except ValueError:
                         continue
-                        
+                    # Validate coordinates
+                    if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                        return {'latitude': latitude, 'longitude': longitude}
+
         except Exception as e:
             logging.debug(f"Advanced coordinate extraction failed: {e}")
         return None
 
-    async def extract_website_advanced(self, page: Page) -> str or None:
-        """Advanced website extraction with multiple strategies."""
+    async def extract_website_advanced(self, page: Page, allow_click: bool = True) -> str or None:
+        """
+        Advanced website extraction with multiple strategies.
+        With allow_click=False the page is only read, never clicked.
+        """
         try:
-            # Strategy 1: Look for website buttons/links
+            # Strategy 1: Look for website buttons/links (all probed in one round-trip)
             selectors = [
                 'a[data-item-id="authority"]',
                 'a[aria-label*="Website"]',
                 'a[data-value="Website"]',
                 'button[data-item-id="authority"]',
                 '[data-item-id="authority"] a',
-                'a[href*="http"]:has-text("Website")',
                 'a[jsaction*="website"]',
                 '.rogA2c a[href^="http"]'  # New selector for website links
             ]
-            
-            for selector in selectors:
-                try:
-                    element = page.locator(selector).first
-                    if await element.count() > 0:
-                        href = await element.get_attribute('href')
-                        if href and href.startswith('http'):
-                            # Clean up Google redirect URLs
-                            if 'google.com/url?q=' in href:
-                                import urllib.parse
-                                parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                                if 'q' in parsed:
-                                    return parsed['q'][0]
-                            return href
-                except Exception:
-                    continue
+
+            hrefs = await page.evaluate(_FIRST_ATTRIBUTE_JS, [selectors, ['href']])
+            for href in hrefs:
+                if href and href.startswith('http'):
+                    # Clean up Google redirect URLs
+                    if _GOOGLE_REDIRECT in href:
+                        return parse_qs(urlsplit(href).query).get('q', [href])[0]
+                    return href
             
             # Strategy 2: Try clicking on contact/info buttons to reveal website
+            if allow_click:
+                return await self._reveal_website_by_click(page)
+
+        except Exception as e:
+            logging.debug(f"Advanced website extraction failed: {e}")
+        return None
+
+    async def _reveal_website_by_click(self, page: Page) -> str or None:
+        """Click contact/info buttons that may reveal the website link."""
+        try:
             info_buttons = [
                 'button:has-text("Website")',
                 '[aria-label*="website" i]',
@@ -392,24 +643,25 @@ class GoogleMapsScraper:
                         await page.wait_for_timeout(1000)
                         
                         # Look for revealed website link
-                        link = page.locator('a[href^="http"]').first
-                        if await link.count() > 0:
-                            href = await link.get_attribute('href')
-                            if href:
-                                return href
+                        [href] = await page.evaluate(_FIRST_ATTRIBUTE_JS, [['a[href^="http"]'], ['href']])
+                        if href:
+                            return href
                         break
                 except Exception:
                     continue
-                    
+
         except Exception as e:
-            logging.debug(f"Advanced website extraction failed: {e}")
+            logging.debug(f"Website click extraction failed: {e}")
         return None
 
 
-    async def extract_image_advanced(self, page: Page) -> str or None:
-        """Advanced image extraction with multiple strategies."""
+    async def extract_image_advanced(self, page: Page, allow_click: bool = True) -> str or None:
+        """
+        Advanced image extraction with multiple strategies.
+        With allow_click=False the page is only read, never clicked.
+        """
         try:
-            # Strategy 1: Look for main business image/photo
+            # Strategy 1: Look for main business image/photo (all probed in one round-trip)
             selectors = [
                 'img[data-src*="googleusercontent.com"]',  # Google's CDN images
                 'img[src*="googleusercontent.com"]',
@@ -423,25 +675,16 @@ class GoogleMapsScraper:
                 'img[src*="places"]',  # Places images
                 '[jsaction*="photo"] img'  # Interactive photo elements
             ]
-            
-            for selector in selectors:
-                try:
-                    element = page.locator(selector).first
-                    if await element.count() > 0:
-                        # Try data-src first (lazy loaded images)
-                        img_url = await element.get_attribute('data-src')
-                        if not img_url:
-                            # Fallback to src attribute
-                            img_url = await element.get_attribute('src')
-                        
-                        if img_url and self.is_valid_image_url(img_url):
-                            # Clean up the image URL
-                            cleaned_url = self.clean_image_url(img_url)
-                            if cleaned_url:
-                                logging.info(f"✅ Image found with selector '{selector}': {cleaned_url}")
-                                return cleaned_url
-                except Exception:
-                    continue
+
+            # Try data-src first (lazy loaded images), then src
+            img_urls = await page.evaluate(_FIRST_ATTRIBUTE_JS, [selectors, ['data-src', 'src']])
+            for selector, img_url in zip(selectors, img_urls):
+                if img_url and self.is_valid_image_url(img_url):
+                    # Clean up the image URL
+                    cleaned_url = self.clean_image_url(img_url)
+                    if cleaned_url:
+                        logging.info(f"✅ Image found with selector '{selector}': {cleaned_url}")
+                        return cleaned_url
             
             # Strategy 2: Look for images in photo galleries or carousels
             try:
@@ -452,55 +695,57 @@ class GoogleMapsScraper:
                     '.RZ66Rb img'  # Photo gallery
                 ]
                 
-                for selector in gallery_selectors:
-                    elements = page.locator(selector)
-                    count = await elements.count()
-                    if count > 0:
-                        # Get the first image
-                        first_img = elements.first
-                        img_url = await first_img.get_attribute('data-src') or await first_img.get_attribute('src')
-                        if img_url and self.is_valid_image_url(img_url):
-                            cleaned_url = self.clean_image_url(img_url)
-                            if cleaned_url:
-                                logging.info(f"✅ Gallery image found: {cleaned_url}")
-                                return cleaned_url
-                        
+                # First image of each gallery, in one round-trip
+                img_urls = await page.evaluate(_FIRST_ATTRIBUTE_JS, [gallery_selectors, ['data-src', 'src']])
+                for img_url in img_urls:
+                    if img_url and self.is_valid_image_url(img_url):
+                        cleaned_url = self.clean_image_url(img_url)
+                        if cleaned_url:
+                            logging.info(f"✅ Gallery image found: {cleaned_url}")
+                            return cleaned_url
+
             except Exception:
                 pass
             
             # Strategy 3: Try clicking on photo buttons to reveal images
-            try:
-                photo_buttons = [
-                    'button:has-text("Photo")',
-                    '[aria-label*="photo" i]',
-                    'button[data-value*="photo" i]',
-                    '[jsaction*="photo"]'
-                ]
-                
-                for selector in photo_buttons:
-                    button = page.locator(selector).first
-                    if await button.count() > 0:
-                        await button.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
-                        
-                        # Look for revealed images
-                        revealed_img = page.locator('img[src*="googleusercontent.com"]').first
-                        if await revealed_img.count() > 0:
-                            img_url = await revealed_img.get_attribute('src')
-                            if img_url and self.is_valid_image_url(img_url):
-                                cleaned_url = self.clean_image_url(img_url)
-                                if cleaned_url:
-                                    logging.info(f"✅ Image found after clicking: {cleaned_url}")
-                                    return cleaned_url
-                        break
-                        
-            except Exception:
-                pass
-                    
+            if allow_click:
+                return await self._reveal_image_by_click(page)
+
         except Exception as e:
             logging.debug(f"Advanced image extraction failed: {e}")
         return None
 
+    async def _reveal_image_by_click(self, page: Page) -> str or None:
+        """Click photo buttons that may reveal the business image."""
+        try:
+            photo_buttons = [
+                'button:has-text("Photo")',
+                '[aria-label*="photo" i]',
+                'button[data-value*="photo" i]',
+                '[jsaction*="photo"]'
+            ]
+            
+            for selector in photo_buttons:
+                button = page.locator(selector).first
+                if await button.count() > 0:
+                    await button.click(timeout=3000)
+                    await page.wait_for_timeout(1000)
+                    
+                    # Look for revealed images
+                    [img_url] = await page.evaluate(
+                        _FIRST_ATTRIBUTE_JS, [['img[src*="googleusercontent.com"]'], ['src']]
+                    )
+                    if img_url and self.is_valid_image_url(img_url):
+                        cleaned_url = self.clean_image_url(img_url)
+                        if cleaned_url:
+                            logging.info(f"✅ Image found after clicking: {cleaned_url}")
+                            return cleaned_url
+                    break
+                    
+        except Exception:
+            pass
+        return None
+
     def is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image URL."""
         if not url or not isinstance(url, str):
@@ -534,10 +779,9 @@ class GoogleMapsScraper:
             # Remove unnecessary parameters for better image quality
             if 'googleusercontent.com' in url:
                 # Remove size restrictions to get full-size image
-                import re
                 # Remove size parameters like =s100-k-no or =w100-h100
-                url = re.sub(r'=s\d+-.*?(?=&|$)', '', url)
-                url = re.sub(r'=w\d+-h\d+.*?(?=&|$)', '', url)
+                url = _GUSR_SIZE_RE.sub('', url)
+                url = _GUSR_WH_RE.sub('', url)
                 # Add high quality parameters
                 if '=' not in url:
                     url += '=s1000'  # Request up to 1000px size
@@ -551,6 +795,11 @@ class GoogleMapsScraper:
             return url  # Return original if cleaning fails
 
 
+async def _none() -> None:
+    """Placeholder coroutine for skipped extractions in asyncio.gather."""
+    return None
+
+
 # PUBLIC FUNCTIONS
 def scrape_places(search_for: str, total: int) -> List[Place]:
     """
@@ -567,6 +816,18 @@ async def _scrape_places_async(search_for: str, total: int) -> List[Place]:
     return await scraper.scrape_places(search_for, total)
 
 
+async def iter_places(search_for: str, total: int, headless: bool = False,
+                      fast_mode: bool = False) -> AsyncIterator[Place]:
+    """
+    Public async interface that yields places as they are scraped,
+    so callers can write results out without buffering them all.
+    """
+    logging.info(f"🚀 Starting scraping for '{search_for}' - Target: {total} places")
+    scraper = GoogleMapsScraper(headless=headless, fast_mode=fast_mode)
+    async for place in scraper.iter_places(search_for, total):
+        yield place
+
+
 def scrape_places_headless(search_for: str, total: int) -> List[Place]:
     """Headless version."""
     logging.info(f"🚀 Starting headless scraping for '{search_for}' - Target: {total} places")
@@ -579,4 +840,4 @@ async def _scrape_places_headless_async(search_for: str, total: int) -> List[Pla
     return await scraper.scrape_places(search_for, total)
 
 
-__all__ = ['scrape_places', 'scrape_places_headless', 'GoogleMapsScraper', 'BrowserManager']
\ No newline at end of file
+__all__ = ['scrape_places', 'scrape_places_headless', 'iter_places', 'GoogleMapsScraper', 'BrowserManager']
\ No newline at end of file
@@ -3,11 +3,209 @@
 import asyncio
 import logging
 import re
+import urllib.parse
 from typing import Optional
-from patchright.async_api import Page
+from patchright.async_api import Page, Error as PlaywrightError
 from .models import Place
 
 
+# Coordinates in a Google Maps URL
+_COORD_URL_PATTERNS = tuple(re.compile(p) for p in (
+    r'/@(-?\d+\.?\d*),(-?\d+\.?\d*),',  # Standard pattern
+    r'/place/[^/]+/@(-?\d+\.?\d*),(-?\d+\.?\d*)',  # Place-specific
+    r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)',  # Alternative format
+    r'center=(-?\d+\.?\d*),(-?\d+\.?\d*)',  # Center parameter
+))
+
+# Searches the page HTML in the browser and returns only the first plausible
+# [lat, lng] pair, so the full HTML never has to be sent to Python
+_COORDS_IN_PAGE_JS = r"""() => {
+    const patterns = [
+        /null,\[null,null,(-?\d+\.?\d*),(-?\d+\.?\d*)\]/g,
+        /\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]/g,
+        /"lat":(-?\d+\.?\d*),"lng":(-?\d+\.?\d*)/g,
+        /"latitude":(-?\d+\.?\d*),"longitude":(-?\d+\.?\d*)/g,
+        /center.*?\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]/g,
+        /position.*?(-?\d+\.?\d*),(-?\d+\.?\d*)/g,
+        /coordinates.*?\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]/g,
+        // Last: the first !3d/!4d in the page is often a related place's link
+        /!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)/g
+    ];
+    const html = document.documentElement.outerHTML;
+    for (const pattern of patterns) {
+        for (const match of html.matchAll(pattern)) {
+            const lat = parseFloat(match[1]);
+            const lng = parseFloat(match[2]);
+            // Valid range and not (0,0)
+            if (Math.abs(lat) <= 90 && Math.abs(lng) <= 180 &&
+                Math.abs(lat) > 0.001 && Math.abs(lng) > 0.001) {
+                return [lat, lng];
+            }
+        }
+    }
+    return null;
+}"""
+
+# Website URLs in the page content (http(s)://... or bare www....); the lookahead
+# rejects Google/YouTube/Facebook hosts while matching, including subdomains the
+# single-label host pattern would otherwise cut short (maps.google.com -> maps.google)
+_WEBSITE_SCAN_RE = re.compile(
+    r'(?:https?://|(?=www\.))'
+    r'(?!(?:[a-z0-9-]+\.)*(?:google|gstatic|googleapis|youtube|facebook)\.com)'
+    r'(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s"\'<>]*)?',
+    re.IGNORECASE
+)
+
+# Website link selectors: plain tag/attribute selectors that native querySelectorAll
+# can evaluate, and ones that need Playwright's own selector engine
+_WEBSITE_FAST_SELECTORS = (
+    'a[data-item-id="authority"]',  # Primary website button
+    'a[aria-label*="Website" i]',   # Case insensitive
+    'a[data-value="Website"]',
+    'button[data-item-id="authority"] a',
+    '[data-item-id="authority"] a[href]',
+    '.rogA2c a[href^="http"]',  # Website in contact section
+    'a[data-item-id="authority"] .Io6YTe',
+    '.CsEnBe a[href^="http"]'  # Another potential container
+)
+_WEBSITE_SLOW_SELECTORS = (
+    'a[href*="http"]:has-text("Website")',
+    'a[jsaction*="website"]'
+)
+_HREF_AND_TEXT_JS = "el => [el.getAttribute('href'), el.textContent]"
+
+# Selectors for each field, most specific first
+_NAME_SELECTORS = (
+    'h1[data-attrid="title"]',
+    'h1.DUwDvf',
+    '[data-attrid="title"] h1',
+    'h1.x3AX1-LfntMc-header-title-title',
+    '.x3AX1-LfntMc-header-title h1',
+    'h1',
+    '.qrShPb h1',
+    '.SPZz6b h1'
+)
+
+_ADDRESS_SELECTORS = (
+    '[data-item-id="address"] .Io6YTe',
+    '.Io6YTe[data-value="Address"]',
+    'button[data-item-id="address"]',
+    '[data-attrid="kc:/location/location:address"]',
+    '.rogA2c .Io6YTe',
+    '[data-item-id="address"] span',
+    'button[data-item-id="address"] .Io6YTe'
+)
+
+_PHONE_SELECTORS = (
+    '[data-item-id="phone:tel:"] .Io6YTe',
+    'button[data-item-id^="phone"]',
+    '[data-value*="phone"] .Io6YTe',
+    'a[href^="tel:"]',
+    '[data-item-id*="phone"] span',
+    '.rogA2c a[href^="tel:"]'
+)
+
+_RATING_SELECTORS = (
+    '.MW4etd',
+    '.ceNzKf',
+    '[jsaction*="pane.rating"]',
+    '.fontDisplayLarge',
+    'span.ceNzKf[aria-hidden="true"]'
+)
+
+_REVIEWS_COUNT_SELECTORS = (
+    '.UY7F9',
+    'button[aria-label*="reviews"]',
+    '[data-value="Reviews count"]',
+    '.fontTitleSmall .UY7F9',
+    'span.UY7F9'
+)
+
+_COORD_DATA_SELECTORS = (
+    '[data-lat][data-lng]',
+    '[data-latitude][data-longitude]',
+    '[data-coords]',
+    '[jsaction*="coordinates"]'
+)
+
+_WEBSITE_INFO_BUTTONS = (
+    'button:has-text("Website")',
+    '[aria-label*="website" i]',
+    'button[data-value*="website" i]',
+    'button:has-text("Visit website")',
+    '.RcCsl button'  # Contact info buttons
+)
+
+_IMAGE_SELECTORS = (
+    'img[data-src*="googleusercontent.com"]',  # Main Google CDN images
+    'img[src*="googleusercontent.com"]',
+    'button img[src*="googleusercontent.com"]',  # Images in buttons
+    '.ZKCDEc img',  # Main image container
+    '.UCw5gc img',  # Another image container
+    '[data-photo-index="0"] img',  # First photo in gallery
+    'img[alt*="Photo"]',  # Images with photo alt text
+    '.gallery img:first-child',  # First gallery image
+    'img[src*="streetviewpixels"]',  # Street view images
+    'img[src*="places"]',  # Google Places images
+    '[jsaction*="photo"] img:first-child'  # First interactive photo
+)
+
+_IMAGE_FALLBACK_SELECTORS = (
+    'img[src*="http"]',
+    'img[data-src*="http"]'
+)
+_FALLBACK_IMAGE_URLS_JS = """
+(selectors) => selectors.flatMap(sel =>
+    Array.from(document.querySelectorAll(sel)).slice(0, 5)
+        .map(el => el.getAttribute('data-src') || el.getAttribute('src'))
+        .filter(Boolean))
+"""
+
+# First match of each selector, in the order given, read in a single round trip.
+# A comma-joined selector would return matches in document order instead, letting
+# an ancestor or a catch-all like 'h1' win over the more specific selectors.
+_FIRST_TEXTS_JS = "selectors => selectors.map(selector => document.querySelector(selector)?.textContent ?? null)"
+_FIRST_IMAGE_URLS_JS = """selectors => selectors.map(selector => {
+    const el = document.querySelector(selector);
+    return el && (el.getAttribute('data-src') || el.getAttribute('src'));
+})"""
+_FIRST_HREF_AND_TEXT_JS = f"""selectors => selectors.map(selector => {{
+    const el = document.querySelector(selector);
+    return el && ({_HREF_AND_TEXT_JS})(el);
+}})"""
+
+# Domains that are never a business website; matched anywhere in the host, so
+# subdomains and country hosts such as google.com.pk are excluded too
+_EXCLUDED_DOMAINS = (
+    'google.com', 'gstatic.com', 'googleapis.com',
+    'maps.google.com', 'youtube.com'
+)
+
+# Substrings that disqualify URLs found by scanning the page content, anywhere in
+# the URL (e.g. a ?ref=facebook.com query), not just in the host
+_CONTENT_EXCLUDED = ('google.com', 'gstatic.com', 'googleapis.com', 'youtube.com', 'facebook.com')
+
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_REVIEWS_RE = re.compile(r'(\d+)')
+
+# Image URL indicators: base64/blob URLs, user avatars and profile pictures are
+# rejected; Google image hosts/paths or common image extensions are accepted
+_IMG_INVALID_RE = re.compile(r'data:image|blob:|avatar|profile', re.IGNORECASE)
+_IMG_VALID_RE = re.compile(
+    r'googleusercontent\.com|streetviewpixels|places|maps\.gstatic\.com|\.(?:jpe?g|png|webp)',
+    re.IGNORECASE
+)
+
+# Size parameters on googleusercontent image URLs, e.g. =s100-k-no or =w100-h100
+_GUC_SIZE_RE = re.compile(r'(?:=s\d+-|=w\d+-h\d+)[^&]*')
+_GUC_HAS_S_RE = re.compile(r'=s\d+')
+
+
+async def _resolved(value):
+    """Awaitable stand-in for an extractor whose result is already known."""
+    return value
+
+
 async def extract_place(page: Page) -> Place:
     """
     Extract place information WITHOUT reviews.
@@ -16,242 +214,174 @@ async def extract_place(page: Page) -> Place:
     place = Place()
     
     try:
-        # Extract basic information
-        place.name = await extract_name(page)
-        place.address = await extract_address(page)
-        place.phone = await extract_phone(page)
-        place.rating = await extract_rating(page)
-        place.reviews_count = await extract_reviews_count(page)
+        # The URL is a local string, so parse it first; the page-based coordinate
+        # fallbacks are only scheduled when it has no coordinates
+        url_coordinates = _parse_coords_from_url(page.url)
         
-        # Extract website URL with improved logic
-        place.website = await extract_website(page)
+        # The read-only extractors are independent, so let the browser handle them concurrently
+        results = await asyncio.gather(
+            extract_name(page),
+            extract_address(page),
+            extract_phone(page),
+            extract_rating(page),
+            extract_reviews_count(page),
+            extract_image(page),
+            extract_coordinates(page) if url_coordinates is None else _resolved(url_coordinates),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logging.debug("Extractor failed: %s", result)
+        (place.name, place.address, place.phone, place.rating,
+         place.reviews_count, place.image_url, coordinates) = (
+            None if isinstance(result, Exception) else result for result in results
+        )
         
-        # Extract image URL with improved logic
-        place.image_url = await extract_image(page)
+        # Extract website URL with improved logic. Runs last on its own because
+        # it may click buttons to reveal the link, which changes the page.
+        place.website = await extract_website(page)
         
-        # Extract coordinates with improved logic
-        coordinates = await extract_coordinates(page)
         if coordinates:
             place.latitude = coordinates.get('latitude')
             place.longitude = coordinates.get('longitude')
         
-        logging.info(f"Extracted: {place.name} | Website: {place.website} | Image: {place.image_url} | Coords: ({place.latitude}, {place.longitude})")
+        logging.info(
+            "Extracted: %s | Website: %s | Image: %s | Coords: (%s, %s)",
+            place.name, place.website, place.image_url, place.latitude, place.longitude
+        )
         
     except Exception as e:
-        logging.error(f"Error extracting place data: {e}")
+        logging.error("Error extracting place data: %s", e)
     
     return place
 
 
 async def extract_name(page: Page) -> Optional[str]:
     """Extract place name with improved selectors."""
-    selectors = [
-        'h1[data-attrid="title"]',
-        'h1.DUwDvf',
-        '[data-attrid="title"] h1',
-        'h1.x3AX1-LfntMc-header-title-title',
-        '.x3AX1-LfntMc-header-title h1',
-        'h1',
-        '.qrShPb h1',
-        '.SPZz6b h1'
-    ]
-    
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                name = await element.text_content()
-                if name and name.strip() and len(name.strip()) > 0:
-                    return name.strip()
-        except:
-            continue
+    # First match of each selector, in priority order, in one round trip
+    try:
+        for name in await page.evaluate(_FIRST_TEXTS_JS, list(_NAME_SELECTORS)):
+            name = (name or '').strip()
+            if name:
+                return name
+    except PlaywrightError:
+        pass
     
     return "Unknown"
 
 
 async def extract_address(page: Page) -> Optional[str]:
     """Extract place address with improved selectors."""
-    selectors = [
-        '[data-item-id="address"] .Io6YTe',
-        '.Io6YTe[data-value="Address"]',
-        'button[data-item-id="address"]',
-        '[data-attrid="kc:/location/location:address"]',
-        '.rogA2c .Io6YTe',
-        '[data-item-id="address"] span',
-        'button[data-item-id="address"] .Io6YTe'
-    ]
-    
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                address = await element.text_content()
-                if address and address.strip():
-                    return address.strip()
-        except:
-            continue
+    # First match of each selector, in priority order, in one round trip
+    try:
+        for address in await page.evaluate(_FIRST_TEXTS_JS, list(_ADDRESS_SELECTORS)):
+            address = (address or '').strip()
+            if address:
+                return address
+    except PlaywrightError:
+        pass
     
     return None
 
 
 async def extract_phone(page: Page) -> Optional[str]:
     """Extract phone number with improved selectors."""
-    selectors = [
-        '[data-item-id="phone:tel:"] .Io6YTe',
-        'button[data-item-id^="phone"]',
-        '[data-value*="phone"] .Io6YTe',
-        'a[href^="tel:"]',
-        '[data-item-id*="phone"] span',
-        '.rogA2c a[href^="tel:"]'
-    ]
-    
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                phone = await element.text_content()
-                if phone and phone.strip():
-                    return phone.strip()
-        except:
-            continue
+    # First match of each selector, in priority order, in one round trip
+    try:
+        for phone in await page.evaluate(_FIRST_TEXTS_JS, list(_PHONE_SELECTORS)):
+            phone = (phone or '').strip()
+            if phone:
+                return phone
+    except PlaywrightError:
+        pass
     
     return None
 
 
 async def extract_rating(page: Page) -> Optional[float]:
     """Extract rating with improved selectors."""
-    selectors = [
-        '.MW4etd',
-        '.ceNzKf',
-        '[jsaction*="pane.rating"]',
-        '.fontDisplayLarge',
-        'span.ceNzKf[aria-hidden="true"]'
-    ]
-    
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                rating_text = await element.text_content()
-                if rating_text:
-                    # Extract number from rating text
-                    rating_match = re.search(r'(\d+\.?\d*)', rating_text.strip())
-                    if rating_match:
-                        rating = float(rating_match.group(1))
-                        if 0 <= rating <= 5:  # Validate rating range
-                            return rating
-        except:
-            continue
+    # First match of each selector, validated here in priority order
+    try:
+        for rating_text in await page.evaluate(_FIRST_TEXTS_JS, list(_RATING_SELECTORS)):
+            if rating_text:
+                # Extract number from rating text
+                rating_match = _RATING_RE.search(rating_text.strip())
+                if rating_match:
+                    rating = float(rating_match.group(1))
+                    if 0 <= rating <= 5:  # Validate rating range
+                        return rating
+    except PlaywrightError:
+        pass
     
     return None
 
 
 async def extract_reviews_count(page: Page) -> Optional[int]:
     """Extract number of reviews with improved selectors."""
-    selectors = [
-        '.UY7F9',
-        'button[aria-label*="reviews"]',
-        '[data-value="Reviews count"]',
-        '.fontTitleSmall .UY7F9',
-        'span.UY7F9'
-    ]
-    
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                reviews_text = await element.text_content()
-                if reviews_text:
-                    # Extract number from reviews text (e.g., "(123)" or "123 reviews")
-                    reviews_match = re.search(r'(\d+)', reviews_text.replace(',', ''))
-                    if reviews_match:
-                        return int(reviews_match.group(1))
-        except:
-            continue
+    # First match of each selector, validated here in priority order
+    try:
+        for reviews_text in await page.evaluate(_FIRST_TEXTS_JS, list(_REVIEWS_COUNT_SELECTORS)):
+            if reviews_text:
+                # Extract number from reviews text (e.g., "(123)" or "123 reviews")
+                reviews_match = _REVIEWS_RE.search(reviews_text.replace(',', ''))
+                if reviews_match:
+                    return int(reviews_match.group(1))
+    except PlaywrightError:
+        pass
     
     return None
 
 
-async def extract_coordinates(page: Page) -> Optional[dict]:
-    """
-    IMPROVED coordinate extraction with multiple fallback methods.
-    """
-    coordinates = None
-    
-    # Method 1: Extract from URL (most reliable)
+def _parse_coords_from_url(url: str) -> Optional[dict]:
+    """Parse coordinates out of a Google Maps URL. Plain string work, no browser round trip."""
     try:
-        current_url = page.url
-        logging.info(f"🗺️ Extracting coordinates from URL: {current_url}")
+        logging.info("🗺️ Extracting coordinates from URL: %s", url)
         
         # Multiple URL patterns for coordinates
-        patterns = [
-            r'/@(-?\d+\.?\d*),(-?\d+\.?\d*),',  # Standard pattern
-            r'/place/[^/]+/@(-?\d+\.?\d*),(-?\d+\.?\d*)',  # Place-specific
-            r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)',  # Alternative format
-            r'center=(-?\d+\.?\d*),(-?\d+\.?\d*)',  # Center parameter
-        ]
-        
-        for pattern in patterns:
-            coord_match = re.search(pattern, current_url)
+        for pattern in _COORD_URL_PATTERNS:
+            coord_match = pattern.search(url)
             if coord_match:
                 latitude = float(coord_match.group(1))
                 longitude = float(coord_match.group(2))
                 # Validate coordinates
                 if -90 <= latitude <= 90 and -180 <= longitude <= 180:
-                    coordinates = {'latitude': latitude, 'longitude': longitude}
-                    logging.info(f"✅ Coordinates from URL: {latitude}, {longitude}")
-                    return coordinates
+                    logging.info("✅ Coordinates from URL: %s, %s", latitude, longitude)
+                    return {'latitude': latitude, 'longitude': longitude}
                     
     except Exception as e:
-        logging.debug(f"Failed to extract coordinates from URL: {e}")
+        logging.debug("Failed to extract coordinates from URL: %s", e)
     
-    # Method 2: Extract from page content/scripts
+    return None
+
+
+async def extract_coordinates(page: Page) -> Optional[dict]:
+    """
+    IMPROVED coordinate extraction with multiple fallback methods.
+    """
+    # Method 1: Extract from URL (most reliable)
+    coordinates = _parse_coords_from_url(page.url)
+    if coordinates:
+        return coordinates
+    
+    # Method 2: Search the page content/scripts in the browser
+    # (only reached when the URL had no coordinates; the place panel has loaded by now)
     try:
-        await page.wait_for_timeout(1000)  # Wait for scripts to load
-        page_content = await page.content()
-        
-        # Enhanced patterns for finding coordinates in page content
-        coord_patterns = [
-            r'null,\[null,null,(-?\d+\.?\d*),(-?\d+\.?\d*)\]',
-            r'\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]',
-            r'"lat":(-?\d+\.?\d*),"lng":(-?\d+\.?\d*)',
-            r'"latitude":(-?\d+\.?\d*),"longitude":(-?\d+\.?\d*)',
-            r'center.*?\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]',
-            r'position.*?(-?\d+\.?\d*),(-?\d+\.?\d*)',
-            r'coordinates.*?\[(-?\d+\.?\d*),(-?\d+\.?\d*)\]'
-        ]
-        
-        for pattern in coord_patterns:
-            matches = re.findall(pattern, page_content)
-            if matches:
-                try:
-                    # Try all matches, sometimes first match is not the right one
-                    for match in matches:
-                        lat, lng = match[0], match[1]
-                        latitude = float(lat)
-                        longitude = float(lng)
-                        # Validate coordinates and check if they seem reasonable
-                        if (-90 <= latitude <= 90 and -180 <= longitude <= 180 and 
-                            abs(latitude) > 0.001 and abs(longitude) > 0.001):  # Not (0,0)
-                            coordinates = {'latitude': latitude, 'longitude': longitude}
-                            logging.info(f"✅ Coordinates from content: {latitude}, {longitude}")
-                            return coordinates
-                except (ValueError, IndexError):
-                    continue
+        result = await page.evaluate(_COORDS_IN_PAGE_JS)
+        if result:
+            latitude, longitude = float(result[0]), float(result[1])
+            # Validate coordinates and check if they seem reasonable
+            if (-90 <= latitude <= 90 and -180 <= longitude <= 180 and 
+                abs(latitude) > 0.001 and abs(longitude) > 0.001):  # Not (0,0)
+                coordinates = {'latitude': latitude, 'longitude': longitude}
+                logging.info("✅ Coordinates from content: %s, %s", latitude, longitude)
+                return coordinates
                     
     except Exception as e:
-        logging.debug(f"Failed to extract coordinates from page content: {e}")
+        logging.debug("Failed to extract coordinates from page content: %s", e)
     
     # Method 3: Try to extract from data attributes
     try:
-        data_selectors = [
-            '[data-lat][data-lng]',
-            '[data-latitude][data-longitude]',
-            '[data-coords]',
-            '[jsaction*="coordinates"]'
-        ]
-        
-        for selector in data_selectors:
+        for selector in _COORD_DATA_SELECTORS:
             element = page.locator(selector).first
             if await element.count() > 0:
                 lat = (await element.get_attribute('data-lat') or 
@@ -264,11 +394,11 @@ async def extract_coordinates(page: Page) -> Optional[dict]:
                     longitude = float(lng)
                     if -90 <= latitude <= 90 and -180 <= longitude <= 180:
                         coordinates = {'latitude': latitude, 'longitude': longitude}
-                        logging.info(f"✅ Coordinates from attributes: {latitude}, {longitude}")
+                        logging.info("✅ Coordinates from attributes: %s, %s", latitude, longitude)
                         return coordinates
                         
     except Exception as e:
-        logging.debug(f"Failed to extract coordinates from attributes: {e}")
+        logging.debug("Failed to extract coordinates from attributes: %s", e)
     
     if not coordinates:
         logging.warning("⚠️ Could not extract coordinates from any method")
@@ -276,63 +406,67 @@ async def extract_coordinates(page: Page) -> Optional[dict]:
     return coordinates
 
 
+def _website_from_link(candidate: Optional[list]) -> Optional[str]:
+    """Website URL from an [href, textContent] pair, or None if neither holds one."""
+    if not candidate:
+        return None
+    href, text_content = candidate
+    
+    if href and href.startswith('http'):
+        # Clean up the URL
+        cleaned_url = clean_website_url(href)
+        if cleaned_url:
+            logging.info("✅ Website found from link: %s", cleaned_url)
+            return cleaned_url
+    
+    # If no href, try getting text content that might be a URL
+    if text_content and ('http' in text_content or 'www.' in text_content):
+        url = text_content.strip()
+        if not url.startswith('http'):
+            url = 'https://' + url.lstrip('www.')
+        cleaned_url = clean_website_url(url)
+        if cleaned_url:
+            logging.info("✅ Website from text: %s", cleaned_url)
+            return cleaned_url
+    
+    return None
+
+
 async def extract_website(page: Page) -> Optional[str]:
     """
     IMPROVED website URL extraction with multiple strategies and better cleaning.
     """
-    # Strategy 1: Direct selectors for website links
-    selectors = [
-        'a[data-item-id="authority"]',  # Primary website button
-        'a[aria-label*="Website" i]',   # Case insensitive
-        'a[data-value="Website"]',
-        'button[data-item-id="authority"] a',
-        '[data-item-id="authority"] a[href]',
-        'a[href*="http"]:has-text("Website")',
-        'a[jsaction*="website"]',
-        '.rogA2c a[href^="http"]',  # Website in contact section
-        'a[data-item-id="authority"] .Io6YTe',
-        '.CsEnBe a[href^="http"]'  # Another potential container
-    ]
+    # Strategy 1: Direct selectors for website links. Plain tag/attribute selectors
+    # go through the browser's native querySelector first, all in one round trip;
+    # Playwright's slower selector engine is only used for the :has-text()/jsaction
+    # ones if they fail. Only the first match of each selector is read, in priority order.
+    try:
+        candidates = await page.evaluate(_FIRST_HREF_AND_TEXT_JS, list(_WEBSITE_FAST_SELECTORS))
+    except PlaywrightError as e:
+        logging.debug("Failed to query website selectors: %s", e)
+        candidates = []
+    
+    for candidate in candidates:
+        website = _website_from_link(candidate)
+        if website:
+            return website
     
-    for selector in selectors:
+    for selector in _WEBSITE_SLOW_SELECTORS:
         try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                href = await element.get_attribute('href')
-                if href and href.startswith('http'):
-                    # Clean up the URL
-                    cleaned_url = await clean_website_url(href)
-                    if cleaned_url:
-                        logging.info(f"✅ Website found with selector '{selector}': {cleaned_url}")
-                        return cleaned_url
-                
-                # If no href, try getting text content that might be a URL
-                text_content = await element.text_content()
-                if text_content and ('http' in text_content or 'www.' in text_content):
-                    url = text_content.strip()
-                    if not url.startswith('http'):
-                        url = 'https://' + url.lstrip('www.')
-                    cleaned_url = await clean_website_url(url)
-                    if cleaned_url:
-                        logging.info(f"✅ Website from text: {cleaned_url}")
-                        return cleaned_url
-                        
-        except Exception as e:
-            logging.debug(f"Failed with selector {selector}: {e}")
+            candidate = await page.locator(selector).evaluate_all(
+                f"els => els.length ? ({_HREF_AND_TEXT_JS})(els[0]) : null"
+            )
+        except PlaywrightError as e:
+            logging.debug("Failed to query website selector %s: %s", selector, e)
             continue
+        website = _website_from_link(candidate)
+        if website:
+            return website
     
     # Strategy 2: Look for website in expanded contact info
     try:
         # Try to find and click contact/info buttons that might reveal website
-        info_buttons = [
-            'button:has-text("Website")',
-            '[aria-label*="website" i]',
-            'button[data-value*="website" i]',
-            'button:has-text("Visit website")',
-            '.RcCsl button'  # Contact info buttons
-        ]
-        
-        for selector in info_buttons:
+        for selector in _WEBSITE_INFO_BUTTONS:
             try:
                 button = page.locator(selector).first
                 if await button.count() > 0:
@@ -345,41 +479,33 @@ async def extract_website(page: Page) -> Optional[str]:
                     if await revealed_link.count() > 0:
                         href = await revealed_link.get_attribute('href')
                         if href:
-                            cleaned_url = await clean_website_url(href)
+                            cleaned_url = clean_website_url(href)
                             if cleaned_url:
-                                logging.info(f"✅ Website found after clicking: {cleaned_url}")
+                                logging.info("✅ Website found after clicking: %s", cleaned_url)
                                 return cleaned_url
                     break
-            except Exception:
+            except PlaywrightError:
                 continue
                 
     except Exception as e:
-        logging.debug(f"Failed to extract website through clicking: {e}")
+        logging.debug("Failed to extract website through clicking: %s", e)
     
     # Strategy 3: Search in page content for website URLs
     try:
-        page_content = await page.content()
+        content = await page.content()
         
         # Look for website URLs in the page content
-        url_patterns = [
-            r'https?://(?:www\.)?[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s"\'<>]*)?',
-            r'www\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}(?:/[^\s"\'<>]*)?'
-        ]
-        
-        for pattern in url_patterns:
-            matches = re.findall(pattern, page_content)
-            for match in matches:
-                if not any(exclude in match.lower() for exclude in 
-                          ['google.com', 'gstatic.com', 'googleapis.com', 'youtube.com', 'facebook.com']):
-                    if not match.startswith('http'):
-                        match = 'https://' + match
-                    cleaned_url = await clean_website_url(match)
-                    if cleaned_url:
-                        logging.info(f"✅ Website from content: {cleaned_url}")
-                        return cleaned_url
+        for match in _WEBSITE_SCAN_RE.finditer(content):
+            url = match.group(0)
+            if any(exclude in url.lower() for exclude in _CONTENT_EXCLUDED):
+                continue
+            cleaned_url = clean_website_url(url)
+            if cleaned_url:
+                logging.info("✅ Website from content: %s", cleaned_url)
+                return cleaned_url
                         
     except Exception as e:
-        logging.debug(f"Failed to extract website from content: {e}")
+        logging.debug("Failed to extract website from content: %s", e)
     
     logging.debug("❌ No website URL found")
     return None
@@ -390,62 +516,33 @@ async def extract_image(page: Page) -> Optional[str]:
     Extract main business image URL from Google Maps place page.
     """
     # Primary selectors for business images
-    selectors = [
-        'img[data-src*="googleusercontent.com"]',  # Main Google CDN images
-        'img[src*="googleusercontent.com"]',
-        'button img[src*="googleusercontent.com"]',  # Images in buttons
-        '.ZKCDEc img',  # Main image container
-        '.UCw5gc img',  # Another image container
-        '[data-photo-index="0"] img',  # First photo in gallery
-        'img[alt*="Photo"]',  # Images with photo alt text
-        '.gallery img:first-child',  # First gallery image
-        'img[src*="streetviewpixels"]',  # Street view images
-        'img[src*="places"]',  # Google Places images
-        '[jsaction*="photo"] img:first-child'  # First interactive photo
-    ]
+    try:
+        # First match of each selector in priority order; data-src first (lazy loaded images), then src
+        img_urls = await page.evaluate(_FIRST_IMAGE_URLS_JS, list(_IMAGE_SELECTORS))
+    except PlaywrightError:
+        img_urls = []
     
-    for selector in selectors:
-        try:
-            element = page.locator(selector).first
-            if await element.count() > 0:
-                # Try data-src first (lazy loaded images)
-                img_url = await element.get_attribute('data-src')
-                if not img_url:
-                    # Fallback to src attribute
-                    img_url = await element.get_attribute('src')
-                
-                if img_url and is_valid_image_url(img_url):
-                    # Clean up the image URL
-                    cleaned_url = clean_image_url(img_url)
-                    if cleaned_url:
-                        logging.info(f"✅ Image URL extracted: {cleaned_url}")
-                        return cleaned_url
-        except Exception:
-            continue
+    for img_url in img_urls:
+        if img_url and is_valid_image_url(img_url):
+            # Clean up the image URL
+            cleaned_url = clean_image_url(img_url)
+            if cleaned_url:
+                logging.info("✅ Image URL extracted: %s", cleaned_url)
+                return cleaned_url
     
-    # Fallback: Try to find any reasonable image
+    # Fallback: Try to find any reasonable image. First 5 images per selector,
+    # read in one round trip and filtered here.
     try:
-        fallback_selectors = [
-            'img[src*="http"]',
-            'img[data-src*="http"]'
-        ]
-        
-        for selector in fallback_selectors:
-            elements = page.locator(selector)
-            count = await elements.count()
-            
-            for i in range(min(count, 5)):  # Check first 5 images
-                element = elements.nth(i)
-                img_url = await element.get_attribute('data-src') or await element.get_attribute('src')
-                
-                if img_url and is_valid_image_url(img_url):
-                    cleaned_url = clean_image_url(img_url)
-                    if cleaned_url:
-                        logging.info(f"✅ Fallback image URL extracted: {cleaned_url}")
-                        return cleaned_url
-                        
-    except Exception:
-        pass
+        fallback_urls = await page.evaluate(_FALLBACK_IMAGE_URLS_JS, list(_IMAGE_FALLBACK_SELECTORS))
+    except PlaywrightError:
+        fallback_urls = []
+    
+    for img_url in fallback_urls:
+        if is_valid_image_url(img_url):
+            cleaned_url = clean_image_url(img_url)
+            if cleaned_url:
+                logging.info("✅ Fallback image URL extracted: %s", cleaned_url)
+                return cleaned_url
     
     logging.debug("❌ No image URL found")
     return None
@@ -460,30 +557,10 @@ def is_valid_image_url(url: str) -> bool:
     if not url.startswith(('http://', 'https://', '//')):
         return False
     
-    # Check if it contains image-related domains or paths
-    valid_indicators = [
-        'googleusercontent.com',
-        'streetviewpixels',
-        'places',
-        'maps.gstatic.com',
-        '.jpg', '.jpeg', '.png', '.webp'
-    ]
-    
-    # Exclude obviously wrong URLs
-    invalid_indicators = [
-        'data:image',  # Base64 images
-        'blob:',       # Blob URLs
-        'avatar',      # User avatars
-        'profile'      # Profile pictures
-    ]
-    
-    url_lower = url.lower()
-    
-    # Must have valid indicators and not have invalid ones
-    has_valid = any(indicator in url_lower for indicator in valid_indicators)
-    has_invalid = any(indicator in url_lower for indicator in invalid_indicators)
-    
-    return has_valid and not has_invalid
+    # Exclude obviously wrong URLs, then require an image-related domain or path
+    if _IMG_INVALID_RE.search(url):
+        return False
+    return bool(_IMG_VALID_RE.search(url))
 
 
 def clean_image_url(url: str) -> Optional[str]:
@@ -498,32 +575,46 @@ def clean_image_url(url: str) -> Optional[str]:
         
         # Optimize Google User Content URLs for better quality
         if 'googleusercontent.com' in url:
-            import re
             # Remove size restrictions to get larger image
-            url = re.sub(r'=s\d+-.*?(?=&|$)', '', url)
-            url = re.sub(r'=w\d+-h\d+.*?(?=&|$)', '', url)
+            url = _GUC_SIZE_RE.sub('', url)
             
             # Add high quality parameters
             if '=' not in url:
                 url += '=s800'  # Request up to 800px size
-            elif not re.search(r'=s\d+', url):
+            elif not _GUC_HAS_S_RE.search(url):
                 url += '&s=800'
         
         return url
         
     except Exception as e:
-        logging.debug(f"Failed to clean image URL {url}: {e}")
+        logging.debug("Failed to clean image URL %s: %s", url, e)
         return url  # Return original if cleaning fails
 
 
-async def clean_website_url(url: str) -> Optional[str]:
+def _fast_host(url: str) -> str:
+    """Host name of an absolute URL, found with plain string searches instead of urlparse."""
+    i = url.find('://')
+    if i < 0:
+        return ''
+    start = i + 3
+    # Same terminators urlparse uses for the netloc
+    end = len(url)
+    for sep in '/?#':
+        j = url.find(sep, start, end)
+        if j >= 0:
+            end = j
+    # Drop userinfo and port, like urlsplit(url).hostname
+    start = url.rfind('@', start, end) + 1 or start
+    j = url.find(':', start, end)
+    return url[start:j] if j >= 0 else url[start:end]
+
+
+def clean_website_url(url: str) -> Optional[str]:
     """
     Clean and validate website URL.
     Removes Google redirects and validates the URL.
     """
     try:
-        import urllib.parse
-        
         # Handle Google redirect URLs
         if 'google.com/url?q=' in url:
             parsed = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
@@ -540,18 +631,13 @@ async def clean_website_url(url: str) -> Optional[str]:
             url = 'https://' + url
         
         # Basic validation
-        parsed_url = urllib.parse.urlparse(url)
-        if parsed_url.netloc and '.' in parsed_url.netloc:
+        host = _fast_host(url).lower()
+        if host and '.' in host:
             # Filter out obviously wrong URLs
-            excluded_domains = [
-                'google.com', 'gstatic.com', 'googleapis.com', 
-                'maps.google.com', 'youtube.com', 'facebook.com/tr'
-            ]
-            
-            if not any(domain in parsed_url.netloc.lower() for domain in excluded_domains):
+            if not any(domain in host for domain in _EXCLUDED_DOMAINS):
                 return url
                 
     except Exception as e:
-        logging.debug(f"Failed to clean URL {url}: {e}")
+        logging.debug("Failed to clean URL %s: %s", url, e)
     
     return None
\ No newline at end of file
@@ -1,73 +1,192 @@
 # reviews.py - SIMPLE PATCHRIGHT VERSION
 import asyncio
 import logging
-import re
+import os
+import weakref
 from typing import List, Dict
-from patchright.async_api import Page
+from patchright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# XPath selectors, most specific first. Kept at module level so the strings are
+# built once and Playwright always receives the same selector text.
+
+# Reviews tab/button
+_REVIEWS_TAB_XPATHS = (
+    '//button[contains(@data-value, "Sort")]',
+    '//button[contains(@aria-label, "reviews") or contains(@aria-label, "Reviews")]',
+    '//div[contains(@role, "tablist")]//button[contains(text(), "Reviews")]',
+    '//button[contains(@jsaction, "pane.reviewChart")]',
+    '//button[@data-tab-index="1"]'  # Often the reviews tab
+)
+
+# Review elements (Google Maps changes these frequently)
+_REVIEW_CONTAINER_XPATHS = (
+    '//div[contains(@class, "jftiEf")]',  # Common review container
+    '//div[contains(@class, "MyEned")]',  # Another review container
+    '//div[contains(@data-review-id, "")]',  # Reviews with IDs
+    '//div[@role="article" and contains(@class, "fontBodyMedium")]',  # Article role reviews
+    '//div[contains(@class, "gws-localreviews__google-review")]',  # Local reviews
+    '//div[contains(@jsaction, "mouseover:pane.review")]'  # Interactive reviews
+)
+
+# Fields inside a single review element
+_AUTHOR_XPATHS = (
+    './/div[contains(@class, "d4r55")]',  # Common author class
+    './/span[contains(@class, "X43Kjb")]',  # Another author class
+    './/div[contains(@class, "TSUbDb")]//a',  # Author link
+    './/button[contains(@class, "WEGxnd")]',  # Author button
+    './/div[contains(@class, "YAp4Ce")]',  # New author class
+    './/a[contains(@href, "/maps/contrib/")]'  # Contributor link
+)
+
+_TEXT_XPATHS = (
+    './/span[contains(@class, "wiI7pd")]',  # Main review text
+    './/div[contains(@class, "MyEned")]//span',  # Alternative text
+    './/span[contains(@data-expandable-section, "")]',  # Expandable text
+    './/div[contains(@class, "ZZ4bLe")]',  # New text class
+    './/span[contains(@jsaction, "click:pane.review.expandReview")]'  # Expandable review
+)
+
+_DATE_XPATHS = (
+    './/span[contains(@class, "rsqaWe")]',
+    './/span[contains(@class, "dehysf")]',
+    './/div[contains(@class, "p2TkOb")]'
+)
+
+# Waiting on the class-based containers only: the data-review-id arm of
+# _REVIEW_CONTAINER_XPATHS matches any div and would end the wait immediately
+_REVIEWS_LOADED_XPATH = "xpath=" + " | ".join(f"({x})" for x in _REVIEW_CONTAINER_XPATHS[:2])
+
+# True once the container XPath matches more nodes than before the scroll
+_MORE_REVIEWS_JS = """
+([xpath, previous]) => document.evaluate(
+    'count(' + xpath + ')', document, null, XPathResult.NUMBER_TYPE, null
+).numberValue > previous
+"""
+
+# Rating: star count in the aria-label, falling back to counting star icons
+_RATING_LABEL_XPATH = './/*[contains(@aria-label, "star") or contains(@aria-label, "Star")]'
+_STAR_ICON_XPATH = './/*[contains(@class, "kvMYJc")]'
+
+# Reads every field of the first `limit` reviews in one round trip. Returns
+# [{author, rating, text, date}, ...] with '' for fields that were not found.
+_EXTRACT_REVIEWS_JS = """
+([containerXPath, authorXPaths, textXPaths, dateXPaths, ratingXPath, starXPath, limit]) => {
+    const ratingRe = /(\\d+)/;  // Built once per call, reused for every review
+    const snapshot = (xpath, context) => document.evaluate(
+        xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    // Selectors are tried in priority order; like locator.first, only the first
+    // match of each is read before moving on to the next selector
+    const firstText = (xpaths, context, minLength) => {
+        for (const xpath of xpaths) {
+            const node = document.evaluate(
+                xpath, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            const text = node ? (node.innerText || '').trim() : '';
+            if (text.length >= minLength) return text;
+        }
+        return '';
+    };
+    // Only the first labelled node is read, and star icons are only counted
+    // when the label has no number
+    const rating = (node) => {
+        const labelled = document.evaluate(
+            ratingXPath, node, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (labelled) {
+            const match = (labelled.getAttribute('aria-label') || '').match(ratingRe);
+            if (match) return parseInt(match[1], 10);
+        }
+        return document.evaluate(
+            'count(' + starXPath + ')', node, null, XPathResult.NUMBER_TYPE, null).numberValue;
+    };
+    const containers = snapshot(containerXPath, document);
+    const reviews = [];
+    for (let i = 0; i < Math.min(containers.snapshotLength, limit); i++) {
+        const node = containers.snapshotItem(i);
+        reviews.push({
+            author: firstText(authorXPaths, node, 1),
+            rating: rating(node),
+            text: firstText(textXPaths, node, 4),
+            date: firstText(dateXPaths, node, 1)
+        });
+    }
+    return reviews;
+}
+"""
+
+
+# Caps how many pages run extract_reviews at once when callers gather it over
+# many places. Override with SOD_REVIEWS_CONCURRENCY.
+_REVIEWS_CONCURRENCY = int(os.getenv("SOD_REVIEWS_CONCURRENCY", "8"))
+
+# One semaphore per event loop: a semaphore binds to the first loop that waits on
+# it, so sharing one across asyncio.run calls would fail under contention
+_reviews_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _reviews_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's semaphore, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _reviews_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _reviews_semaphores[loop] = asyncio.Semaphore(_REVIEWS_CONCURRENCY)
+    return semaphore
+
 
 # Simple review dictionary instead of complex model
 async def extract_reviews(page: Page) -> List[Dict]:
     """Extract reviews from Google Maps place page"""
+    async with _reviews_semaphore():
+        return await _extract_reviews(page)
+
+
+async def _extract_reviews(page: Page) -> List[Dict]:
     reviews = []
     
     try:
         logging.info("Scrolling to load reviews...")
         
-        # Try to find and click reviews tab/button
+        # Try to find and click reviews tab/button. The counts are independent,
+        # so probe every selector at once and click the first match in priority order.
         try:
-            # Multiple selectors for reviews tab
-            reviews_selectors = [
-                '//button[contains(@data-value, "Sort")]',
-                '//button[contains(@aria-label, "reviews") or contains(@aria-label, "Reviews")]',
-                '//div[contains(@role, "tablist")]//button[contains(text(), "Reviews")]',
-                '//button[contains(@jsaction, "pane.reviewChart")]',
-                '//button[@data-tab-index="1"]'  # Often the reviews tab
-            ]
-            
-            for selector in reviews_selectors:
-                try:
-                    button = page.locator(selector)
-                    if await button.count() > 0:
+            buttons = [page.locator(selector) for selector in _REVIEWS_TAB_XPATHS]
+            counts = await asyncio.gather(*(button.count() for button in buttons), return_exceptions=True)
+            for button, count in zip(buttons, counts):
+                if isinstance(count, int) and count > 0:
+                    try:
                         await button.first.click()
                         logging.info("Clicked reviews tab")
-                        await asyncio.sleep(3)
                         break
-                except:
-                    continue
+                    except Exception:
+                        continue
         except Exception as e:
             logging.debug(f"Failed to click reviews tab: {e}")
         
-        # Wait a bit for reviews to load
-        await asyncio.sleep(3)
+        # Wait for reviews to load, resuming as soon as the first one is visible
+        try:
+            await page.wait_for_selector(_REVIEWS_LOADED_XPATH, state='visible', timeout=5000)
+        except PlaywrightTimeoutError:
+            await asyncio.sleep(0.5)
         
         # Try to scroll to reviews section
         try:
             reviews_section = page.locator('//div[contains(@aria-label, "Reviews") or contains(@class, "review")]')
             if await reviews_section.count() > 0:
                 await reviews_section.first.scroll_into_view_if_needed()
-                await asyncio.sleep(1)
         except:
             pass
         
-        # Multiple selectors for review elements (Google Maps changes these frequently)
-        review_selectors = [
-            '//div[contains(@class, "jftiEf")]',  # Common review container
-            '//div[contains(@class, "MyEned")]',  # Another review container
-            '//div[contains(@data-review-id, "")]',  # Reviews with IDs
-            '//div[@role="article" and contains(@class, "fontBodyMedium")]',  # Article role reviews
-            '//div[contains(@class, "gws-localreviews__google-review")]',  # Local reviews
-            '//div[contains(@jsaction, "mouseover:pane.review")]'  # Interactive reviews
-        ]
-        
         review_elements = None
+        review_xpath = None
         
-        # Try different selectors
-        for selector in review_selectors:
-            elements = page.locator(selector)
-            count = await elements.count()
+        # Try different selectors for review elements, counted concurrently
+        candidates = [page.locator(selector) for selector in _REVIEW_CONTAINER_XPATHS]
+        counts = await asyncio.gather(*(elements.count() for elements in candidates))
+        for selector, elements, count in zip(_REVIEW_CONTAINER_XPATHS, candidates, counts):
             if count > 0:
                 logging.info(f"Found {count} review elements with selector: {selector}")
                 review_elements = elements
+                review_xpath = selector
                 break
         
         if not review_elements:
@@ -85,18 +204,19 @@ async def extract_reviews(page: Page) -> List[Dict]:
                 star_count = await star_elements.count()
                 logging.info(f"Found {star_count} elements with star ratings")
                 
-                # Try to get the page HTML structure for debugging
-                if debug_count == 0 and star_count == 0:
-                    body_html = await page.locator('body').inner_html()
-                    # Log first 500 chars to see page structure
-                    logging.debug(f"Page HTML structure: {body_html[:500]}...")
+                # Try to get the page HTML structure for debugging. Only the first
+                # 500 chars leave the browser, and only when DEBUG logging is on.
+                if debug_count == 0 and star_count == 0 and logging.getLogger().isEnabledFor(logging.DEBUG):
+                    body_html = await page.evaluate("() => document.body.innerHTML.slice(0, 500)")
+                    logging.debug(f"Page HTML structure: {body_html}...")
                     
             except Exception as e:
                 logging.debug(f"Debug failed: {e}")
                 
             return reviews
             
-        # Scroll to load more reviews
+        # Scroll to load more reviews. The matched locator is reused throughout,
+        # count() re-queries the page on every call.
         max_scrolls = 5
         for scroll_attempt in range(max_scrolls):
             try:
@@ -106,122 +226,34 @@ async def extract_reviews(page: Page) -> List[Dict]:
                 if current_count >= 10 or scroll_attempt >= max_scrolls - 1:
                     break
                 
-                # Scroll down
+                # Scroll down and wait until more reviews have rendered
                 await page.mouse.wheel(0, 3000)
-                await asyncio.sleep(2)
-                
-                # Re-count after scroll
-                review_elements = page.locator(review_selectors[0])  # Use first working selector
+                try:
+                    await page.wait_for_function(
+                        _MORE_REVIEWS_JS, arg=[review_xpath, current_count], timeout=3000
+                    )
+                except PlaywrightTimeoutError:
+                    await asyncio.sleep(0.5)
                 
             except Exception as e:
                 logging.warning(f"Scroll attempt {scroll_attempt + 1} failed: {e}")
                 continue
         
-        # Extract individual reviews
-        total_reviews = await review_elements.count()
-        logging.info(f"Extracting data from {total_reviews} reviews...")
+        # Extract individual reviews, all fields in a single evaluate
+        raw_reviews = await page.evaluate(_EXTRACT_REVIEWS_JS, [
+            review_xpath, list(_AUTHOR_XPATHS), list(_TEXT_XPATHS), list(_DATE_XPATHS),
+            _RATING_LABEL_XPATH, _STAR_ICON_XPATH, 20  # Limit to 20 reviews
+        ])
+        logging.info(f"Extracting data from {len(raw_reviews)} reviews...")
         
-        for i in range(min(total_reviews, 20)):  # Limit to 20 reviews
-            try:
-                review_element = review_elements.nth(i)
-                review_data = {}
-                
-                # Extract author name - try multiple selectors
-                author_selectors = [
-                    './/div[contains(@class, "d4r55")]',  # Common author class
-                    './/span[contains(@class, "X43Kjb")]',  # Another author class
-                    './/div[contains(@class, "TSUbDb")]//a',  # Author link
-                    './/button[contains(@class, "WEGxnd")]',  # Author button
-                    './/div[contains(@class, "YAp4Ce")]',  # New author class
-                    './/a[contains(@href, "/maps/contrib/")]'  # Contributor link
-                ]
-                
-                for auth_sel in author_selectors:
-                    try:
-                        author_element = review_element.locator(auth_sel)
-                        if await author_element.count() > 0:
-                            author_text = await author_element.first.inner_text()
-                            if author_text and len(author_text.strip()) > 0:
-                                review_data['author'] = author_text.strip()
-                                logging.debug(f"Found author: {author_text.strip()}")
-                                break
-                    except Exception as e:
-                        logging.debug(f"Author selector {auth_sel} failed: {e}")
-                        continue
-                
-                # Extract rating - try multiple approaches
-                try:
-                    # Look for aria-label with star rating
-                    rating_elements = review_element.locator('.//*[contains(@aria-label, "star") or contains(@aria-label, "Star")]')
-                    if await rating_elements.count() > 0:
-                        aria_label = await rating_elements.first.get_attribute("aria-label")
-                        if aria_label:
-                            rating_match = re.search(r'(\d+)', aria_label)
-                            if rating_match:
-                                review_data['rating'] = int(rating_match.group(1))
-                    
-                    # Alternative: look for star icons
-                    if 'rating' not in review_data:
-                        star_elements = review_element.locator('.//*[contains(@class, "kvMYJc")]')
-                        review_data['rating'] = await star_elements.count()
-                        
-                except Exception as e:
-                    logging.debug(f"Failed to extract rating for review {i + 1}: {e}")
-                
-                # Extract review text
-                text_selectors = [
-                    './/span[contains(@class, "wiI7pd")]',  # Main review text
-                    './/div[contains(@class, "MyEned")]//span',  # Alternative text
-                    './/span[contains(@data-expandable-section, "")]',  # Expandable text
-                    './/div[contains(@class, "ZZ4bLe")]',  # New text class
-                    './/span[contains(@jsaction, "click:pane.review.expandReview")]'  # Expandable review
-                ]
-                
-                for text_sel in text_selectors:
-                    try:
-                        text_element = review_element.locator(text_sel)
-                        if await text_element.count() > 0:
-                            review_text = await text_element.first.inner_text()
-                            if review_text and len(review_text.strip()) > 3:
-                                review_data['text'] = review_text.strip()
-                                logging.debug(f"Found review text: {review_text[:50]}...")
-                                break
-                    except Exception as e:
-                        logging.debug(f"Text selector {text_sel} failed: {e}")
-                        continue
-                
-                # Extract date
-                date_selectors = [
-                    './/span[contains(@class, "rsqaWe")]',
-                    './/span[contains(@class, "dehysf")]',
-                    './/div[contains(@class, "p2TkOb")]'
-                ]
-                
-                for date_sel in date_selectors:
-                    try:
-                        date_element = review_element.locator(date_sel)
-                        if await date_element.count() > 0:
-                            date_text = await date_element.first.inner_text()
-                            if date_text and len(date_text.strip()) > 0:
-                                review_data['date'] = date_text.strip()
-                                break
-                    except:
-                        continue
+        for review_data in raw_reviews:
+            # Only add review if we got some meaningful data
+            if review_data['author'] or review_data['text']:
+                # Set defaults for missing fields
+                review_data['author'] = review_data['author'] or 'Anonymous'
                 
-                # Only add review if we got some meaningful data
-                if review_data.get('author') or review_data.get('text'):
-                    # Set defaults for missing fields
-                    review_data.setdefault('author', 'Anonymous')
-                    review_data.setdefault('rating', 0)
-                    review_data.setdefault('text', '')
-                    review_data.setdefault('date', '')
-                    
-                    reviews.append(review_data)
-                    logging.debug(f"Extracted review {len(reviews)}: {review_data.get('author', 'Unknown')}")
-                    
-            except Exception as e:
-                logging.error(f"Failed to extract review {i + 1}: {e}")
-                continue
+                reviews.append(review_data)
+                logging.debug(f"Extracted review {len(reviews)}: {review_data['author']}")
         
         logging.info(f"Successfully extracted {len(reviews)} reviews")
         
@@ -233,5 +265,24 @@ async def extract_reviews(page: Page) -> List[Dict]:
 
 # Synchronous wrapper for backward compatibility
 def extract_reviews_sync(page) -> List[Dict]:
-    """Synchronous wrapper for extract_reviews"""
-    return asyncio.run(extract_reviews(page))
\ No newline at end of file
+    """
+    Synchronous wrapper for extract_reviews.
+    An async Page can only be driven by the event loop that created it, so the
+    coroutine always runs there: handed over from another thread while that loop
+    is running, or run to completion on it when it is idle. Async code must
+    await extract_reviews(page) instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Blocking here would stall the very loop the page needs
+        raise RuntimeError("extract_reviews_sync() called from a running event loop; await extract_reviews(page) instead")
+    
+    page_loop = getattr(page, "_loop", None)  # Owning loop of the Playwright object
+    if page_loop is None:
+        return asyncio.run(extract_reviews(page))
+    if page_loop.is_running():
+        return asyncio.run_coroutine_threadsafe(extract_reviews(page), page_loop).result()
+    return page_loop.run_until_complete(extract_reviews(page))
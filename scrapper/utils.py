@@ -1,11 +1,39 @@
 # utils.py - NO REVIEWS VERSION - utility functions for places
 
+import asyncio
 import csv
+import json
 import logging
-import os
-from typing import List
+import pathlib
+import sys
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, List, Optional
 from .models import Place
 
+try:
+    import orjson  # Optional, much faster JSON encoder
+except ImportError:
+    orjson = None
+
+# Write buffer for batch CSV saves, so rows are flushed in large chunks
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Output directory, created once per process on the first save
+_OUTPUT_DIR = pathlib.Path("output")
+_OUTPUT_READY = False
+
+# Lists at least this long are validated column-wise with pandas
+VECTORIZE_MIN_PLACES = 500
+
+
+def _ensure_output() -> pathlib.Path:
+    """Create the output directory on first use and return it."""
+    global _OUTPUT_READY
+    if not _OUTPUT_READY:
+        _OUTPUT_DIR.mkdir(exist_ok=True)
+        _OUTPUT_READY = True
+    return _OUTPUT_DIR
+
 
 def save_places_to_csv(places: List[Place], filename: str = "places.csv") -> None:
     """
@@ -17,18 +45,16 @@ def save_places_to_csv(places: List[Place], filename: str = "places.csv") -> Non
     """
     try:
         # Create output directory if it doesn't exist
-        os.makedirs("output", exist_ok=True)
-        filepath = os.path.join("output", filename)
+        filepath = _ensure_output() / filename
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile, lineterminator='\n')
             
             # Write headers
             writer.writerow(Place.csv_headers())
             
-            # Write place data
-            for place in places:
-                writer.writerow(place.to_csv_row())
+            # Write place data in one batched call
+            writer.writerows(Place.iter_csv_rows(places))
         
         logging.info(f"💾 Saved {len(places)} places to {filepath}")
         
@@ -36,6 +62,89 @@ def save_places_to_csv(places: List[Place], filename: str = "places.csv") -> Non
         logging.error(f"❌ Failed to save places to CSV: {e}")
 
 
+async def save_places_to_csv_async(places: List[Place], filename: str = "places.csv") -> None:
+    """
+    Save places to CSV in a worker thread, so the event loop keeps scraping meanwhile.
+    
+    Args:
+        places: List of Place objects
+        filename: Output CSV filename
+    """
+    await asyncio.to_thread(save_places_to_csv, places, filename)
+
+
+async def stream_places_to_files(
+    places: AsyncIterator[Place],
+    csv_filename: str = "places.csv",
+    jsonl_filename: str = "places.jsonl",
+    on_place: Optional[Callable[[int, Place], None]] = None
+) -> "PlacesSummary":
+    """
+    Write places to CSV and JSON Lines as they arrive, so nothing is held in
+    memory and partial results survive an interrupted run.
+    
+    Args:
+        places: Async iterator of Place objects, e.g. scrapper.core.iter_places
+        csv_filename: Output CSV filename
+        jsonl_filename: Output JSON Lines filename
+        on_place: Optional callback, called with (index, place) after each place is written
+        
+    Returns:
+        PlacesSummary: Counts for print_summary
+    """
+    output_dir = _ensure_output()
+    csv_path = output_dir / csv_filename
+    jsonl_path = output_dir / jsonl_filename
+    summary = PlacesSummary()
+    
+    # Default buffering, flushed after every place: rows reach disk as they are
+    # scraped. The large CSV_BUFFER_SIZE is only for batch saves.
+    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile, \
+            open(jsonl_path, 'wb') as jsonlfile:
+        writer = csv.writer(csvfile, lineterminator='\n')
+        writer.writerow(Place.csv_headers())
+        
+        async for place in places:
+            summary.add(place)
+            writer.writerow(place.to_csv_row())
+            jsonlfile.write(_encode_json_line(place.to_dict()))
+            csvfile.flush()
+            jsonlfile.flush()
+            if on_place:
+                on_place(summary.total, place)
+    
+    logging.info(f"💾 Saved {summary.total} places to {csv_path} and {jsonl_path}")
+    return summary
+
+
+@dataclass(slots=True)
+class PlacesSummary:
+    """Running counts for the scraping summary, filled in one place at a time."""
+    total: int = 0
+    with_phone: int = 0
+    with_website: int = 0
+    with_image: int = 0
+    with_coordinates: int = 0
+    with_rating: int = 0
+    samples: List[Place] = field(default_factory=list)  # First 3 places
+    
+    def add(self, place: Place) -> None:
+        """Count one place."""
+        self.total += 1
+        if place.phone:
+            self.with_phone += 1
+        if place.website:
+            self.with_website += 1
+        if place.image_url:
+            self.with_image += 1
+        if place.has_coordinates():
+            self.with_coordinates += 1
+        if place.rating:
+            self.with_rating += 1
+        if len(self.samples) < 3:
+            self.samples.append(place)
+
+
 def print_places_summary(places: List[Place]) -> None:
     """
     Print a summary of scraped places.
@@ -43,41 +152,56 @@ def print_places_summary(places: List[Place]) -> None:
     Args:
         places: List of Place objects
     """
-    print(f"\n{'='*60}")
-    print(f"📊 SCRAPING SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total places scraped: {len(places)}")
+    # Count places with different data in a single pass
+    summary = PlacesSummary()
+    for place in places:
+        summary.add(place)
+    print_summary(summary)
+
+
+def print_summary(summary: PlacesSummary) -> None:
+    """
+    Print a summary from counts collected while scraping.
     
-    # Count places with different data
-    with_phone = sum(1 for p in places if p.phone)
-    with_website = sum(1 for p in places if p.website)
-    with_image = sum(1 for p in places if p.image_url)
-    with_coordinates = sum(1 for p in places if p.has_coordinates())
-    with_rating = sum(1 for p in places if p.rating)
+    Args:
+        summary: PlacesSummary filled with the scraped places
+    """
+    # Built up and written in one go instead of one write per line
+    lines = []
+    lines.append(f"\n{'='*60}")
+    lines.append(f"📊 SCRAPING SUMMARY")
+    lines.append(f"{'='*60}")
+    total = summary.total
+    lines.append(f"Total places scraped: {total}")
     
-    print(f"Places with phone: {with_phone}/{len(places)} ({with_phone/len(places)*100:.1f}%)")
-    print(f"Places with website: {with_website}/{len(places)} ({with_website/len(places)*100:.1f}%)")
-    print(f"Places with image: {with_image}/{len(places)} ({with_image/len(places)*100:.1f}%)")
-    print(f"Places with coordinates: {with_coordinates}/{len(places)} ({with_coordinates/len(places)*100:.1f}%)")
-    print(f"Places with rating: {with_rating}/{len(places)} ({with_rating/len(places)*100:.1f}%)")
+    denominator = total or 1  # Empty runs print 0.0% instead of dividing by zero
+    for label, count in (
+        ("phone", summary.with_phone),
+        ("website", summary.with_website),
+        ("image", summary.with_image),
+        ("coordinates", summary.with_coordinates),
+        ("rating", summary.with_rating),
+    ):
+        lines.append(f"Places with {label}: {count}/{total} ({count / denominator:.1%})")
     
     # Show sample places
-    print(f"\n📍 SAMPLE PLACES:")
-    print(f"{'-'*60}")
-    for i, place in enumerate(places[:3]):  # Show first 3 places
-        print(f"{i+1}. {place.name}")
-        print(f"   📍 {place.address or 'No address'}")
-        print(f"   📞 {place.phone or 'No phone'}")
-        print(f"   🌐 {place.website or 'No website'}")
-        print(f"   🖼️ {place.image_url or 'No image'}")
-        print(f"   ⭐ {place.rating or 'No rating'} ({place.reviews_count or 0} reviews)")
-        print(f"   🗺️  {f'({place.latitude}, {place.longitude})' if place.has_coordinates() else 'No coordinates'}")
-        print()
+    lines.append(f"\n📍 SAMPLE PLACES:")
+    lines.append(f"{'-'*60}")
+    for i, place in enumerate(summary.samples):
+        lines.append(f"{i+1}. {place.name}")
+        lines.append(f"   📍 {place.address or 'No address'}")
+        lines.append(f"   📞 {place.phone or 'No phone'}")
+        lines.append(f"   🌐 {place.website or 'No website'}")
+        lines.append(f"   🖼️ {place.image_url or 'No image'}")
+        lines.append(f"   ⭐ {place.rating or 'No rating'} ({place.reviews_count or 0} reviews)")
+        lines.append(f"   🗺️  {f'({place.latitude}, {place.longitude})' if place.has_coordinates() else 'No coordinates'}")
+        lines.append("")
     
-    if len(places) > 3:
-        print(f"   ... and {len(places) - 3} more places")
+    if total > 3:
+        lines.append(f"   ... and {total - 3} more places")
     
-    print(f"{'='*60}\n")
+    lines.append(f"{'='*60}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_place_data(place: Place) -> dict:
@@ -120,6 +244,51 @@ def validate_place_data(place: Place) -> dict:
     return validation
 
 
+def _is_valid_place(place: Place) -> bool:
+    """The checks validate_place_data makes, inlined and without building a result dict."""
+    name, rating = place.name, place.rating
+    lat, lng = place.latitude, place.longitude
+    return bool(
+        name and name.strip()
+        and ((lat is None and lng is None)
+             or (lat is not None and lng is not None and -90 <= lat <= 90 and -180 <= lng <= 180))
+        and (rating is None or 0 <= rating <= 5)
+    )
+
+
+def _valid_flags_vectorized(places: List[Place]) -> Optional[List[bool]]:
+    """
+    Same checks as _is_valid_place, evaluated as pandas column masks.
+    
+    Args:
+        places: List of Place objects
+        
+    Returns:
+        Optional[List[bool]]: One flag per place, or None if pandas is not installed
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    
+    df = pd.DataFrame({
+        'name': [p.name for p in places],
+        'rating': pd.Series([p.rating for p in places], dtype='float64'),
+        'lat': pd.Series([p.latitude for p in places], dtype='float64'),
+        'lng': pd.Series([p.longitude for p in places], dtype='float64'),
+        # Recorded before the float cast, which turns None into NaN: only a
+        # missing value is allowed, a NaN one is invalid like in _is_valid_place
+        'no_rating': [p.rating is None for p in places],
+        'no_lat': [p.latitude is None for p in places],
+        'no_lng': [p.longitude is None for p in places],
+    })
+    has_name = df['name'].fillna('').str.strip().ne('')
+    # between() is False for NaN, so NaN values fail the range checks
+    rating_ok = df['no_rating'] | df['rating'].between(0, 5)
+    coords_ok = (df['no_lat'] & df['no_lng']) | (df['lat'].between(-90, 90) & df['lng'].between(-180, 180))
+    return (has_name & rating_ok & coords_ok).tolist()
+
+
 def filter_valid_places(places: List[Place]) -> List[Place]:
     """
     Filter out places with invalid data.
@@ -132,17 +301,41 @@ def filter_valid_places(places: List[Place]) -> List[Place]:
     """
     valid_places = []
     
-    for place in places:
-        validation = validate_place_data(place)
-        if validation['valid']:
+    # Large lists are checked column-wise with pandas; small ones (or no pandas)
+    # use the inlined per-place checks, which skip the DataFrame setup cost
+    valid_flags = None
+    if len(places) >= VECTORIZE_MIN_PLACES:
+        valid_flags = _valid_flags_vectorized(places)
+    if valid_flags is None:
+        valid_flags = [_is_valid_place(place) for place in places]
+    
+    for place, is_valid in zip(places, valid_flags):
+        if is_valid:
             valid_places.append(place)
-        else:
-            logging.warning(f"⚠️ Filtered out invalid place: {place.name} - Issues: {validation['issues']}")
+            continue
+        
+        # Full validator only to report the issues
+        validation = validate_place_data(place)
+        logging.warning(f"⚠️ Filtered out invalid place: {place.name} - Issues: {validation['issues']}")
     
     logging.info(f"✅ Filtered places: {len(valid_places)}/{len(places)} valid")
     return valid_places
 
 
+def _encode_json(data) -> bytes:
+    """Encode data as indented UTF-8 JSON, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _encode_json_line(data) -> bytes:
+    """Encode data as one compact UTF-8 JSON line, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
 def export_places_json(places: List[Place], filename: str = "places.json") -> None:
     """
     Export places to JSON file.
@@ -152,17 +345,17 @@ def export_places_json(places: List[Place], filename: str = "places.json") -> No
         filename: Output JSON filename
     """
     try:
-        import json
-        
         # Create output directory if it doesn't exist
-        os.makedirs("output", exist_ok=True)
-        filepath = os.path.join("output", filename)
-        
-        # Convert places to dictionaries
-        places_data = [place.to_dict() for place in places]
+        filepath = _ensure_output() / filename
         
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(places_data, jsonfile, indent=2, ensure_ascii=False)
+        # Stream the array one place at a time instead of building every dict first
+        with open(filepath, 'wb') as jsonfile:
+            jsonfile.write(b'[')
+            for i, place in enumerate(places):
+                jsonfile.write(b',\n  ' if i else b'\n  ')
+                # Nest the element one level (JSON strings never hold raw newlines)
+                jsonfile.write(_encode_json(place.to_dict()).replace(b'\n', b'\n  '))
+            jsonfile.write(b'\n]' if places else b']')
         
         logging.info(f"💾 Exported {len(places)} places to {filepath}")
         
@@ -170,6 +363,17 @@ def export_places_json(places: List[Place], filename: str = "places.json") -> No
         logging.error(f"❌ Failed to export places to JSON: {e}")
 
 
+async def export_places_json_async(places: List[Place], filename: str = "places.json") -> None:
+    """
+    Export places to JSON in a worker thread, so the event loop keeps scraping meanwhile.
+    
+    Args:
+        places: List of Place objects
+        filename: Output JSON filename
+    """
+    await asyncio.to_thread(export_places_json, places, filename)
+
+
 def setup_logging(log_level: str = "INFO") -> None:
     """
     Set up logging configuration.